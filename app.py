@@ -3,13 +3,19 @@ Finance Reconciliation Automation - Main Flask Application
 """
 
 import os
-import json
-from io import StringIO
+import pickle
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from flask import (
     Flask,
     render_template,
     request,
     jsonify,
+    Response,
     session,
     send_file,
     redirect,
@@ -19,8 +25,11 @@ from flask import (
 from werkzeug.utils import secure_filename
 import pandas as pd
 import numpy as np
+import orjson
+import pyarrow as pa
+import zstandard
 from datetime import datetime
-import uuid
+import secrets
 
 from config import Config
 from modules import FileHandler, EntityMatcher, BalanceCalculator, Exporter
@@ -44,6 +53,16 @@ entity_matcher = EntityMatcher(Config)
 balance_calculator = BalanceCalculator(Config)
 exporter = Exporter(Config)
 
+# In-process cache of stored session data: file path -> (mtime, value)
+_DATA_CACHE = OrderedDict()
+_DATA_CACHE_LOCK = threading.Lock()
+
+# Background jobs for long-running routes: job id -> job info
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+_JOBS = {}
+_JOBS_LOCK = threading.Lock()
+
 
 # ==================== UTILITY FUNCTIONS ====================
 
@@ -74,6 +93,9 @@ def convert_to_serializable(obj):
         return {key: convert_to_serializable(value) for key, value in obj.items()}
     elif isinstance(obj, (list, tuple)):
         return [convert_to_serializable(item) for item in obj]
+    elif isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
+        # Lazily built sequences, e.g. balance discrepancies
+        return [convert_to_serializable(item) for item in obj]
     
     # Handle numpy/pandas types
     elif isinstance(obj, (np.integer, np.int64, np.int32, np.int16, np.int8)):
@@ -96,10 +118,30 @@ def convert_to_serializable(obj):
         return obj
 
 
+def ojsonify(obj):
+    """
+    Build a JSON response with orjson, skipping jsonify's pure-Python encoding
+
+    Args:
+        obj: Object to serialize (numpy values are supported)
+
+    Returns:
+        Flask Response with the serialized body
+    """
+    return Response(
+        orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ),
+        mimetype="application/json",
+    )
+
+
 def get_session_id():
     """Get or create session ID"""
     if "session_id" not in session:
-        session["session_id"] = str(uuid.uuid4())
+        session["session_id"] = secrets.token_hex(16)
     return session["session_id"]
 
 
@@ -116,15 +158,474 @@ def set_session_data(key, value):
     session_key = f"{session_id}_{key}"
     session[session_key] = value
 
+    # Track this session's keys so clearing doesn't scan the whole session
+    owned_keys = session.setdefault("_owned_keys", [])
+    if session_key not in owned_keys:
+        owned_keys.append(session_key)
+
+
+def set_session_bulk(updates):
+    """
+    Set several session values in a single session mutation
+
+    Args:
+        updates: Dictionary mapping keys to values
+    """
+    session_id = get_session_id()
+    namespaced = {f"{session_id}_{key}": value for key, value in updates.items()}
+    session.update(namespaced)
+
+    owned_keys = session.setdefault("_owned_keys", [])
+    owned_keys.extend(key for key in namespaced if key not in owned_keys)
+    session.modified = True
+
 
 def clear_session_data():
     """Clear all session data"""
     session_id = session.get("session_id")
     if session_id:
-        keys_to_remove = [key for key in session.keys() if key.startswith(session_id)]
-        for key in keys_to_remove:
+        for key in session.pop("_owned_keys", []):
             session.pop(key, None)
 
+        # Remove data persisted for this session
+        session_dir = os.path.join(app.config["UPLOAD_FOLDER"], session_id)
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+        with _DATA_CACHE_LOCK:
+            for path in [p for p in _DATA_CACHE if p.startswith(session_dir)]:
+                del _DATA_CACHE[path]
+
+        with _JOBS_LOCK:
+            for job_id, job in list(_JOBS.items()):
+                if job["session_id"] == session_id:
+                    del _JOBS[job_id]
+
+
+def get_session_dir():
+    """Get (and create) the directory holding this session's stored data"""
+    session_dir = os.path.join(app.config["UPLOAD_FOLDER"], get_session_id())
+    os.makedirs(session_dir, exist_ok=True)
+    return session_dir
+
+
+def get_session_file(key):
+    """Get the path of a file stored under a session key, or None"""
+    filename = get_session_data(key)
+    if not filename:
+        return None
+    return os.path.join(get_session_dir(), filename)
+
+
+def _cache_put(file_path, mtime, value):
+    """Store a value in the in-process cache, evicting the oldest entries"""
+    with _DATA_CACHE_LOCK:
+        _DATA_CACHE[file_path] = (mtime, value)
+        _DATA_CACHE.move_to_end(file_path)
+        while len(_DATA_CACHE) > Config.DATA_CACHE_SIZE:
+            _DATA_CACHE.popitem(last=False)
+
+
+def _get_cached(key, loader):
+    """
+    Get a stored session value, served from the in-process cache when the file
+    on disk has not changed since it was cached
+
+    Args:
+        key: Session key the value is stored under
+        loader: Callable reading the value from a file path
+
+    Returns:
+        Stored value, or None if nothing is stored under the key
+    """
+    file_path = get_session_file(key)
+    if not file_path:
+        return None
+
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        return None
+
+    with _DATA_CACHE_LOCK:
+        cached = _DATA_CACHE.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            _DATA_CACHE.move_to_end(file_path)
+            return cached[1]
+
+    value = loader(file_path)
+    _cache_put(file_path, mtime, value)
+
+    return value
+
+
+def write_df(key, df):
+    """
+    Persist a DataFrame to disk as Parquet without touching the session
+
+    Frames Arrow cannot represent (e.g. object columns mixing numbers and text,
+    non-string column names) are stored with pickle protocol 5 instead, which
+    keeps every dtype as-is.
+
+    Args:
+        key: Session key the DataFrame is stored under
+        df: DataFrame to persist
+
+    Returns:
+        Filename to store in the session under key
+    """
+    session_dir = get_session_dir()
+    filename = f"{key}.parquet"
+    file_path = os.path.join(session_dir, filename)
+
+    try:
+        df.to_parquet(file_path, engine="pyarrow", compression="zstd")
+    except (pa.ArrowException, ValueError):
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+        filename = f"{key}.pkl"
+        file_path = os.path.join(session_dir, filename)
+        with open(file_path, "wb") as f:
+            pickle.dump(df, f, protocol=5)
+
+    # Write through to the cache so the next request skips the Parquet read
+    _cache_put(file_path, os.path.getmtime(file_path), df)
+
+    return filename
+
+
+def save_df(key, df):
+    """
+    Persist a DataFrame to disk and keep only its filename in session
+
+    Args:
+        key: Session key the DataFrame is stored under
+        df: DataFrame to persist
+    """
+    set_session_data(key, write_df(key, df))
+
+
+def load_df(file_path):
+    """Read a DataFrame written by save_df"""
+    if file_path.endswith(".pkl"):
+        with open(file_path, "rb") as f:
+            return pickle.load(f)
+
+    return pd.read_parquet(file_path, engine="pyarrow")
+
+
+def get_df(key):
+    """
+    Get a session DataFrame stored with save_df
+
+    Args:
+        key: Session key the DataFrame is stored under
+
+    Returns:
+        DataFrame, or None if nothing is stored under the key
+    """
+    return _get_cached(key, load_df)
+
+
+def write_obj(key, obj):
+    """
+    Persist a JSON-serializable object (e.g. matches, review items) to disk and
+    keep the Python object in the in-process cache, without touching the session
+
+    Args:
+        key: Session key the object is stored under
+        obj: Object to persist
+
+    Returns:
+        Filename to store in the session under key
+    """
+    payload = orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    # Large payloads are mostly repetitive JSON; level 1 shrinks them cheaply
+    filename = f"{key}.json"
+    if len(payload) > Config.COMPRESS_THRESHOLD:
+        filename += ".zst"
+        payload = zstandard.ZstdCompressor(level=1).compress(payload)
+
+    file_path = os.path.join(get_session_dir(), filename)
+    with open(file_path, "wb") as f:
+        f.write(payload)
+
+    _cache_put(file_path, os.path.getmtime(file_path), obj)
+
+    return filename
+
+
+def save_obj(key, obj):
+    """
+    Persist a JSON-serializable object to disk and keep its filename in session
+
+    Args:
+        key: Session key the object is stored under
+        obj: Object to persist
+    """
+    set_session_data(key, write_obj(key, obj))
+
+
+def load_obj(file_path):
+    """Read an object written by save_obj"""
+    with open(file_path, "rb") as f:
+        payload = f.read()
+
+    if file_path.endswith(".zst"):
+        payload = zstandard.ZstdDecompressor().decompress(payload)
+
+    return orjson.loads(payload)
+
+
+def get_obj(key, default=None):
+    """
+    Get a session object stored with save_obj
+
+    Args:
+        key: Session key the object is stored under
+        default: Value returned when nothing is stored under the key
+
+    Returns:
+        Stored object, or default
+    """
+    obj = _get_cached(key, load_obj)
+    return default if obj is None else obj
+
+
+def get_summary_statistics():
+    """
+    Get summary statistics for the reconciled transactions
+
+    The summary is stored in the session whenever updated_df changes, so it is
+    only recomputed from the DataFrame when missing.
+
+    Returns:
+        Dictionary containing summary statistics, or None if there is no data
+    """
+    summary = get_session_data("summary_cache")
+    if summary is not None:
+        return summary
+
+    updated_df = get_df("updated_df")
+    if updated_df is None:
+        return None
+
+    summary = convert_to_serializable(file_handler.get_summary_statistics(updated_df))
+    set_session_data("summary_cache", summary)
+
+    return summary
+
+
+# ==================== BACKGROUND JOBS ====================
+
+
+def get_executor():
+    """Get the process pool for long-running jobs, creating it on first use"""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ProcessPoolExecutor(max_workers=Config.JOB_WORKERS)
+        return _EXECUTOR
+
+
+def evict_expired_jobs():
+    """
+    Drop jobs nobody polled for, so their futures and results are released
+
+    A finished job is kept JOB_RESULT_TTL seconds for its client to collect,
+    and any job is dropped JOB_TTL seconds after it was submitted.
+    """
+    now = time.monotonic()
+    with _JOBS_LOCK:
+        for job_id, job in list(_JOBS.items()):
+            finished_at = job.get("finished_at")
+            if (
+                finished_at is not None and now - finished_at > Config.JOB_RESULT_TTL
+            ) or now - job["submitted_at"] > Config.JOB_TTL:
+                # Jobs still waiting for a worker are not run at all
+                job["future"].cancel()
+                del _JOBS[job_id]
+
+
+def submit_job(finish, fn, *args):
+    """
+    Run a function in the worker pool and return a job id for the client to poll
+
+    Args:
+        finish: Callable turning the job's result into the final response;
+            runs in the request context of /job_status
+        fn: Module-level function to run in a worker process
+        *args: Picklable arguments for fn
+
+    Returns:
+        Response with the job id and its status URL
+    """
+    evict_expired_jobs()
+
+    job_id = secrets.token_hex(16)
+    job = {
+        "future": get_executor().submit(fn, *args),
+        "finish": finish,
+        "session_id": get_session_id(),
+        "submitted_at": time.monotonic(),
+    }
+
+    def mark_finished(_):
+        job["finished_at"] = time.monotonic()
+
+    job["future"].add_done_callback(mark_finished)
+    with _JOBS_LOCK:
+        _JOBS[job_id] = job
+
+    return (
+        jsonify(
+            {
+                "success": True,
+                "status": "running",
+                "job_id": job_id,
+                "status_url": url_for("job_status", job_id=job_id),
+            }
+        ),
+        202,
+    )
+
+
+def run_auto_match_job(processed_df_path):
+    """
+    Run the full matching pipeline (worker process)
+
+    Args:
+        processed_df_path: Path of the processed transactions Parquet file
+
+    Returns:
+        Dictionary with the matching results
+    """
+    # Bind the pipeline steps locally to skip repeated global/attribute lookups
+    auto_match_all = entity_matcher.auto_match_all
+    validate_all_matches = balance_calculator.validate_all_matches
+    assign_match_groups = balance_calculator.assign_match_groups
+    generate_review_items = entity_matcher.generate_review_items
+    get_summary_statistics = file_handler.get_summary_statistics
+    calculate_total_balance = balance_calculator.calculate_total_balance
+
+    processed_df = load_df(processed_df_path)
+
+    # Perform auto matching
+    matches, unmatched_expenses, unmatched_revenues = auto_match_all(processed_df)
+
+    # Validate matches
+    valid_matches, invalid_matches = validate_all_matches(matches)
+
+    # Update DataFrame with match information
+    updated_df = assign_match_groups(processed_df, valid_matches)
+
+    # Index unmatched transactions by original row number for O(1) lookups
+    unmatched_expenses = unmatched_expenses.set_index(
+        "original_index", drop=False
+    ).rename_axis(None)
+    unmatched_revenues = unmatched_revenues.set_index(
+        "original_index", drop=False
+    ).rename_axis(None)
+
+    # Generate review items for unmatched transactions
+    review_items = generate_review_items(unmatched_revenues, unmatched_expenses)
+
+    # Calculate statistics
+    summary = get_summary_statistics(updated_df)
+    balance_stats = calculate_total_balance(valid_matches)
+
+    # Convert to serializable format before returning to the web process
+    return {
+        "matches": convert_to_serializable(valid_matches),
+        "review_items": convert_to_serializable(review_items),
+        "summary": convert_to_serializable(summary),
+        "balance_stats": convert_to_serializable(balance_stats),
+        "updated_df": updated_df,
+        "unmatched_expenses": unmatched_expenses,
+        "unmatched_revenues": unmatched_revenues,
+    }
+
+
+def finish_auto_match_job(result):
+    """Store auto-match results in the session and build the response"""
+    set_session_bulk(
+        {
+            "matches": write_obj("matches", result["matches"]),
+            "review_items": write_obj("review_items", result["review_items"]),
+            "updated_df": write_df("updated_df", result["updated_df"]),
+            "unmatched_expenses": write_df(
+                "unmatched_expenses", result["unmatched_expenses"]
+            ),
+            "unmatched_revenues": write_df(
+                "unmatched_revenues", result["unmatched_revenues"]
+            ),
+            "summary_cache": result["summary"],
+        }
+    )
+
+    return jsonify(
+        {
+            "success": True,
+            "status": "done",
+            "matched_count": len(result["matches"]),
+            "review_count": len(result["review_items"]),
+            "summary": result["summary"],
+            "balance_stats": result["balance_stats"],
+        }
+    )
+
+
+def run_export_job(export_type, updated_df_path, matches_path, file_path, options):
+    """
+    Write an export file (worker process)
+
+    Args:
+        export_type: 'new', 'update' or 'report'
+        updated_df_path: Path of the reconciled transactions Parquet file
+        matches_path: Path of the stored matches
+        file_path: Output path ('new'/'report') or original file path ('update')
+        options: Export options (file format or status column settings)
+
+    Returns:
+        Tuple of (success, message, output_path)
+    """
+    updated_df = load_df(updated_df_path)
+    matches = load_obj(matches_path) if matches_path else []
+
+    if export_type == "new":
+        success, message = exporter.create_new_reconciled_file(
+            updated_df, matches, file_path, options["file_format"]
+        )
+        return success, message, file_path
+
+    if export_type == "report":
+        success, message = exporter.generate_reconciliation_report(
+            updated_df, matches, file_path
+        )
+        return success, message, file_path
+
+    return exporter.update_existing_file(file_path, updated_df, matches, options)
+
+
+def finish_export_job(result):
+    """Remember the exported file for download and build the response"""
+    success, message, output_path = result
+
+    if not success:
+        return jsonify({"success": False, "status": "done", "message": message}), 500
+
+    # Store output path for download
+    set_session_data("output_file", output_path)
+    return jsonify(
+        {
+            "success": True,
+            "status": "done",
+            "message": message,
+            "download_url": url_for("download_file"),
+        }
+    )
+
 
 # ==================== ROUTES ====================
 
@@ -163,7 +664,7 @@ def upload_file():
         # Store data in session
         set_session_data("file_path", file_path)
         set_session_data("file_name", file.filename)
-        set_session_data("df_json", df.to_json(orient="split"))
+        save_df("df", df)
         set_session_data("analysis", analysis)
 
         return jsonify(
@@ -195,8 +696,8 @@ def select_columns():
             )
 
         # Get DataFrame from session
-        df_json = get_session_data("df_json")
-        if not df_json:
+        df = get_df("df")
+        if df is None:
             return (
                 jsonify(
                     {
@@ -207,8 +708,6 @@ def select_columns():
                 400,
             )
 
-        df = pd.read_json(StringIO(df_json), orient="split")
-
         # Process transactions
         success, message, processed_df = file_handler.process_transactions(
             df, amount_column, description_column
@@ -218,7 +717,7 @@ def select_columns():
             return jsonify({"success": False, "message": message}), 400
 
         # Store processed data
-        set_session_data("processed_df_json", processed_df.to_json(orient="split"))
+        save_df("processed_df", processed_df)
         set_session_data("amount_column", amount_column)
         set_session_data("description_column", description_column)
 
@@ -230,66 +729,16 @@ def select_columns():
 
 @app.route("/auto_match", methods=["POST"])
 def auto_match():
-    """Perform automatic matching"""
+    """Start automatic matching as a background job"""
     try:
-        # Get processed DataFrame
-        processed_df_json = get_session_data("processed_df_json")
-        if not processed_df_json:
+        processed_df_path = get_session_file("processed_df")
+        if not processed_df_path or not os.path.exists(processed_df_path):
             return (
                 jsonify({"success": False, "message": "No processed data found"}),
                 400,
             )
 
-        processed_df = pd.read_json(StringIO(processed_df_json), orient="split")
-
-        # Perform auto matching
-        matches, unmatched_expenses, unmatched_revenues = entity_matcher.auto_match_all(
-            processed_df
-        )
-
-        # Validate matches
-        valid_matches, invalid_matches = balance_calculator.validate_all_matches(
-            matches
-        )
-
-        # Update DataFrame with match information
-        updated_df = balance_calculator.assign_match_groups(processed_df, valid_matches)
-
-        # Generate review items for unmatched transactions
-        review_items = entity_matcher.generate_review_items(
-            unmatched_revenues, unmatched_expenses
-        )
-
-        # Calculate statistics
-        summary = file_handler.get_summary_statistics(updated_df)
-        balance_stats = balance_calculator.calculate_total_balance(valid_matches)
-
-        # Convert to serializable format before storing
-        valid_matches_serializable = convert_to_serializable(valid_matches)
-        review_items_serializable = convert_to_serializable(review_items)
-        summary_serializable = convert_to_serializable(summary)
-        balance_stats_serializable = convert_to_serializable(balance_stats)
-
-        # Store results in session
-        set_session_data("matches", json.dumps(valid_matches_serializable))
-        set_session_data("review_items", json.dumps(review_items_serializable))
-        set_session_data("updated_df_json", updated_df.to_json(orient="split"))
-        set_session_data(
-            "unmatched_expenses_json", unmatched_expenses.to_json(orient="split")
-        )
-        set_session_data(
-            "unmatched_revenues_json", unmatched_revenues.to_json(orient="split")
-        )
-
-        return jsonify(
-            {
-                "success": True,
-                "matched_count": len(valid_matches),
-                "review_count": len(review_items),
-                "summary": summary_serializable,
-                "balance_stats": balance_stats_serializable,
-            }
-        )
+        return submit_job(finish_auto_match_job, run_auto_match_job, processed_df_path)
 
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
@@ -305,10 +754,9 @@ def matching_page():
 def get_matches():
     """Get matched items for display"""
     try:
-        matches_json = get_session_data("matches", "[]")
-        matches = json.loads(matches_json)
+        matches = get_obj("matches", [])
 
-        return jsonify({"success": True, "matches": matches})
+        return ojsonify({"success": True, "matches": matches})
 
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
@@ -324,10 +772,9 @@ def review_page():
 def get_review_items():
     """Get items that need manual review"""
     try:
-        review_items_json = get_session_data("review_items", "[]")
-        review_items = json.loads(review_items_json)
+        review_items = get_obj("review_items", [])
 
-        return jsonify({"success": True, "review_items": review_items})
+        return ojsonify({"success": True, "review_items": review_items})
 
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
@@ -348,36 +795,41 @@ def confirm_match():
             )
 
         # Get current data
-        updated_df_json = get_session_data("updated_df_json")
-        matches_json = get_session_data("matches", "[]")
-        unmatched_expenses_json = get_session_data("unmatched_expenses_json")
-        unmatched_revenues_json = get_session_data("unmatched_revenues_json")
-
-        updated_df = pd.read_json(StringIO(updated_df_json), orient="split")
-        matches = json.loads(matches_json)
-        unmatched_expenses = pd.read_json(
-            StringIO(unmatched_expenses_json), orient="split"
-        )
-        unmatched_revenues = pd.read_json(
-            StringIO(unmatched_revenues_json), orient="split"
-        )
+        updated_df = get_df("updated_df")
+        matches = get_obj("matches", [])
+        unmatched_expenses = get_df("unmatched_expenses")
+        unmatched_revenues = get_df("unmatched_revenues")
+
+        if (
+            updated_df is None
+            or unmatched_expenses is None
+            or unmatched_revenues is None
+        ):
+            return (
+                jsonify({"success": False, "message": "No match data found"}),
+                400,
+            )
+
+        # Find revenue and expenses (both frames are indexed by original_index)
+        if revenue_index not in unmatched_revenues.index:
+            return (
+                jsonify({"success": False, "message": "Revenue transaction not found"}),
+                400,
+            )
 
-        # Find revenue and expenses
-        revenue = unmatched_revenues[
-            unmatched_revenues["original_index"] == revenue_index
-        ].iloc[0]
-        selected_expenses = unmatched_expenses[
-            unmatched_expenses["original_index"].isin(expense_indices)
+        revenue = unmatched_revenues.loc[revenue_index]
+        selected_expenses = unmatched_expenses.loc[
+            [idx for idx in expense_indices if idx in unmatched_expenses.index]
         ]
 
         # Create new match
+        expense_total = float(selected_expenses["amount"].to_numpy().sum())
         new_match = {
             "match_type": "manual",
             "confidence": 1.0,
             "revenue": revenue.to_dict(),
-            "expenses": [exp.to_dict() for _, exp in selected_expenses.iterrows()],
-            "balance": revenue["amount"]
-            + sum(exp["amount"] for _, exp in selected_expenses.iterrows()),
+            "expenses": selected_expenses.to_dict(orient="records"),
+            "balance": float(revenue["amount"]) + expense_total,
         }
 
         # Validate match
@@ -394,19 +846,18 @@ def confirm_match():
                 400,
             )
 
-        # Add to matches
-        matches.append(new_match)
+        # Add to matches (without mutating the cached list)
+        matches = matches + [new_match]
 
-        # Update DataFrame
-        updated_df = balance_calculator.assign_match_groups(updated_df, matches)
+        # Update only the rows belonging to the new match group; this returns
+        # a copy, so the cached frame changes only through write_df
+        updated_df = balance_calculator.assign_match_group(
+            updated_df, new_match, len(matches) - 1
+        )
 
         # Remove from unmatched
-        unmatched_expenses = unmatched_expenses[
-            ~unmatched_expenses["original_index"].isin(expense_indices)
-        ]
-        unmatched_revenues = unmatched_revenues[
-            unmatched_revenues["original_index"] != revenue_index
-        ]
+        unmatched_expenses = unmatched_expenses.drop(index=selected_expenses.index)
+        unmatched_revenues = unmatched_revenues.drop(index=[revenue_index])
 
         # Regenerate review items
         review_items = entity_matcher.generate_review_items(
@@ -418,15 +869,22 @@ def confirm_match():
         review_items_serializable = convert_to_serializable(review_items)
 
         # Update session
-        set_session_data("matches", json.dumps(matches_serializable))
-        set_session_data("updated_df_json", updated_df.to_json(orient="split"))
-        set_session_data(
-            "unmatched_expenses_json", unmatched_expenses.to_json(orient="split")
-        )
-        set_session_data(
-            "unmatched_revenues_json", unmatched_revenues.to_json(orient="split")
+        set_session_bulk(
+            {
+                "matches": write_obj("matches", matches_serializable),
+                "updated_df": write_df("updated_df", updated_df),
+                "unmatched_expenses": write_df(
+                    "unmatched_expenses", unmatched_expenses
+                ),
+                "unmatched_revenues": write_df(
+                    "unmatched_revenues", unmatched_revenues
+                ),
+                "review_items": write_obj("review_items", review_items_serializable),
+                "summary_cache": convert_to_serializable(
+                    file_handler.get_summary_statistics(updated_df)
+                ),
+            }
         )
-        set_session_data("review_items", json.dumps(review_items_serializable))
 
         return jsonify(
             {
@@ -444,43 +902,34 @@ def confirm_match():
 def export_options_page():
     """Display export options page"""
     # Get summary data
-    updated_df_json = get_session_data("updated_df_json")
-    matches_json = get_session_data("matches", "[]")
+    summary = get_summary_statistics()
 
-    if not updated_df_json:
+    if summary is None:
         return redirect(url_for("index"))
 
-    updated_df = pd.read_json(StringIO(updated_df_json), orient="split")
-    matches = json.loads(matches_json)
-
-    summary = file_handler.get_summary_statistics(updated_df)
-
     return render_template("export_options.html", summary=summary)
 
 
 @app.route("/export", methods=["POST"])
 def export_file():
-    """Export reconciled file"""
+    """Start exporting the reconciled file as a background job"""
     try:
         data = request.get_json()
         export_type = data.get("export_type")  # 'new' or 'update'
         file_format = data.get("file_format", "xlsx")
 
         # Get data from session
-        updated_df_json = get_session_data("updated_df_json")
-        matches_json = get_session_data("matches", "[]")
+        updated_df_path = get_session_file("updated_df")
+        matches_path = get_session_file("matches")
         file_path = get_session_data("file_path")
         file_name = get_session_data("file_name")
 
-        if not updated_df_json or not file_path:
+        if not updated_df_path or not file_path:
             return (
                 jsonify({"success": False, "message": "No data to export"}),
                 400,
             )
 
-        updated_df = pd.read_json(StringIO(updated_df_json), orient="split")
-        matches = json.loads(matches_json)
-
         # Generate output filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         base_name = os.path.splitext(file_name)[0]
@@ -492,8 +941,14 @@ def export_file():
             )
             output_path = os.path.join(app.config["UPLOAD_FOLDER"], output_filename)
 
-            success, message = exporter.create_new_reconciled_file(
-                updated_df, matches, output_path, file_format
+            return submit_job(
+                finish_export_job,
+                run_export_job,
+                "new",
+                updated_df_path,
+                matches_path,
+                output_path,
+                {"file_format": file_format},
             )
 
         elif export_type == "update":
@@ -508,8 +963,14 @@ def export_file():
                 "highlight": highlight,
             }
 
-            success, message, output_path = exporter.update_existing_file(
-                file_path, updated_df, matches, options
+            return submit_job(
+                finish_export_job,
+                run_export_job,
+                "update",
+                updated_df_path,
+                matches_path,
+                file_path,
+                options,
             )
 
         else:
@@ -518,66 +979,75 @@ def export_file():
                 400,
             )
 
-        if success:
-            # Store output path for download
-            set_session_data("output_file", output_path)
-            return jsonify(
-                {
-                    "success": True,
-                    "message": message,
-                    "download_url": url_for("download_file"),
-                }
-            )
-        else:
-            return jsonify({"success": False, "message": message}), 500
-
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
 
 @app.route("/export_report", methods=["POST"])
 def export_report():
-    """Export detailed reconciliation report"""
+    """Start exporting the detailed reconciliation report as a background job"""
     try:
-        updated_df_json = get_session_data("updated_df_json")
-        matches_json = get_session_data("matches", "[]")
+        updated_df_path = get_session_file("updated_df")
+        matches_path = get_session_file("matches")
         file_name = get_session_data("file_name")
 
-        if not updated_df_json:
+        if not updated_df_path:
             return (
                 jsonify({"success": False, "message": "No data to export"}),
                 400,
             )
 
-        updated_df = pd.read_json(StringIO(updated_df_json), orient="split")
-        matches = json.loads(matches_json)
-
         # Generate report filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         base_name = os.path.splitext(file_name)[0]
         report_filename = f"{base_name}_report_{timestamp}.xlsx"
         report_path = os.path.join(app.config["UPLOAD_FOLDER"], report_filename)
 
-        success, message = exporter.generate_reconciliation_report(
-            updated_df, matches, report_path
+        return submit_job(
+            finish_export_job,
+            run_export_job,
+            "report",
+            updated_df_path,
+            matches_path,
+            report_path,
+            {},
         )
 
-        if success:
-            set_session_data("output_file", report_path)
-            return jsonify(
-                {
-                    "success": True,
-                    "message": message,
-                    "download_url": url_for("download_file"),
-                }
-            )
-        else:
-            return jsonify({"success": False, "message": message}), 500
-
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
 
+@app.route("/job_status/<job_id>")
+def job_status(job_id):
+    """Poll a background job; returns the job's final response once finished"""
+    with _JOBS_LOCK:
+        job = _JOBS.get(job_id)
+
+    if job is None or job["session_id"] != session.get("session_id"):
+        return jsonify({"success": False, "message": "Job not found"}), 404
+
+    future = job["future"]
+    if not future.done():
+        return jsonify(
+            {
+                "success": True,
+                "status": "running",
+                "job_id": job_id,
+                "status_url": url_for("job_status", job_id=job_id),
+            }
+        )
+
+    # Only the poll that removes the job builds its response
+    with _JOBS_LOCK:
+        if _JOBS.pop(job_id, None) is None:
+            return jsonify({"success": False, "message": "Job not found"}), 404
+
+    try:
+        return job["finish"](future.result())
+    except Exception as e:
+        return jsonify({"success": False, "status": "failed", "message": str(e)}), 500
+
+
 @app.route("/download")
 def download_file():
     """Download exported file"""
@@ -591,6 +1061,9 @@ def download_file():
             output_file,
             as_attachment=True,
             download_name=os.path.basename(output_file),
+            conditional=True,
+            etag=True,
+            max_age=0,
         )
 
     except Exception as e:
@@ -601,19 +1074,15 @@ def download_file():
 def get_summary():
     """Get reconciliation summary"""
     try:
-        updated_df_json = get_session_data("updated_df_json")
-        matches_json = get_session_data("matches", "[]")
+        summary = get_summary_statistics()
+        matches = get_obj("matches", [])
 
-        if not updated_df_json:
+        if summary is None:
             return (
                 jsonify({"success": False, "message": "No data available"}),
                 400,
             )
 
-        updated_df = pd.read_json(StringIO(updated_df_json), orient="split")
-        matches = json.loads(matches_json)
-
-        summary = file_handler.get_summary_statistics(updated_df)
         balance_stats = balance_calculator.calculate_total_balance(matches)
 
         return jsonify(
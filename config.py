@@ -11,12 +11,19 @@ class Config:
     UPLOAD_FOLDER = os.path.join(
         os.path.dirname(os.path.abspath(__file__)), "data", "uploads"
     )
-    ALLOWED_EXTENSIONS = {"csv", "xlsx", "xls"}
+    ALLOWED_EXTENSIONS = {"csv", "xlsx", "xls", "parquet", "feather"}
     MAX_FILE_SIZE = 16 * 1024 * 1024  # 16MB
+    UPLOAD_BUFFER_SIZE = 4 * 1024 * 1024  # 4MB copy buffer when saving uploads
+    FAST_IO = True  # Read CSV with PyArrow and Excel with calamine when installed
+    POLARS_CSV = True  # Write CSV exports with Polars when installed
+    CSV_CHUNK_ROWS = 10000  # Rows serialized per batch when writing CSV exports
+    COLUMN_SAMPLE_ROWS = 500  # Rows sampled when suggesting a description column
 
     # Session settings
     SESSION_TYPE = "filesystem"
     PERMANENT_SESSION_LIFETIME = 3600  # 1 hour
+    DATA_CACHE_SIZE = 64  # Stored session values kept in memory across requests
+    COMPRESS_THRESHOLD = 4 * 1024  # zstd-compress stored objects larger than this
 
     # Matching algorithm settings
     EXACT_MATCH_THRESHOLD = 1.0
@@ -26,6 +33,21 @@ class Config:
 
     # Balance calculation settings
     BALANCE_TOLERANCE = 0.01  # Tolerance for floating point comparison
+    USE_NUMBA = True  # Use Numba kernels for validation/grouping when installed
+
+    # Background job settings (auto-match and exports run in worker processes).
+    # Jobs are tracked in memory by the web process that started them, so the
+    # app assumes a single web process (e.g. one gunicorn worker with threads);
+    # with several, /job_status polls landing on another process return 404.
+    JOB_WORKERS = min(4, os.cpu_count() or 1)
+    JOB_TTL = 3600  # Seconds after submission before a job is dropped
+    JOB_RESULT_TTL = 300  # Seconds a finished job's result waits to be polled
+    # Threads per RapidFuzz cdist call, sized so JOB_WORKERS concurrent jobs
+    # together use about one thread per CPU
+    FUZZY_WORKERS = max(1, (os.cpu_count() or 1) // JOB_WORKERS)
+
+    # Let the front-end web server (e.g. nginx) send downloads via X-Sendfile
+    USE_X_SENDFILE = os.environ.get("USE_X_SENDFILE", "").lower() in ("1", "true")
 
     # Export settings
     DEFAULT_STATUS_TEXT = "RECONCILED"
@@ -5,8 +5,128 @@ Handles balance computation and validation for reconciliation
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Set
-from itertools import combinations
+from collections.abc import Sequence
+from typing import Dict, Iterator, List, Tuple, Optional, Set
+from itertools import combinations, islice
+from math import comb
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional
+    NUMBA_AVAILABLE = False
+
+# Largest half enumerated by the meet-in-the-middle combination search
+MAX_HALF_SUBSETS = 1 << 22
+
+# Categories of the match_status column
+MATCH_STATUSES = ["matched", "unmatched", "pending_review"]
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _balanced_mask_kernel(amounts, offsets, tolerance):
+        """Per-match balance check over a CSR layout of signed amounts"""
+        n_matches = offsets.shape[0] - 1
+        mask = np.empty(n_matches, dtype=np.bool_)
+        for m in range(n_matches):
+            total = 0.0
+            for k in range(offsets[m], offsets[m + 1]):
+                total += amounts[k]
+            mask[m] = abs(total) < tolerance
+        return mask
+
+    @njit(cache=True)
+    def _group_rows_kernel(positions, offsets, n_rows):
+        """Map each DataFrame row position to the index of its match (-1 if none)"""
+        groups = np.full(n_rows, -1, dtype=np.int64)
+        for m in range(offsets.shape[0] - 1):
+            for k in range(offsets[m], offsets[m + 1]):
+                if positions[k] >= 0:
+                    groups[positions[k]] = m
+        return groups
+
+    @njit(cache=True)
+    def _subset_sum_kernel(expense_cents, target):
+        """
+        Bitset subset-sum DP with backtracking; returns (found, picked) where
+        picked lists the chosen item positions from last to first
+        """
+        n = expense_cents.shape[0]
+        nwords = target // 64 + 1
+        rows = np.zeros((n + 1, nwords), dtype=np.uint64)
+        rows[0, 0] = 1
+
+        for i in range(1, n + 1):
+            word_shift = expense_cents[i - 1] // 64
+            bit_shift = np.uint64(expense_cents[i - 1] % 64)
+            carry_shift = np.uint64(64 - expense_cents[i - 1] % 64)
+            for k in range(nwords):
+                value = rows[i - 1, k]
+                src = k - word_shift
+                if src >= 0:
+                    value |= rows[i - 1, src] << bit_shift
+                    if bit_shift > 0 and src > 0:
+                        value |= rows[i - 1, src - 1] >> carry_shift
+                rows[i, k] = value
+
+        picked = np.empty(n, dtype=np.int64)
+        one = np.uint64(1)
+        if (rows[n, target // 64] >> np.uint64(target % 64)) & one == 0:
+            return False, picked[:0]
+
+        count = 0
+        i = n
+        j = target
+        while i > 0 and j > 0:
+            if (rows[i - 1, j // 64] >> np.uint64(j % 64)) & one:
+                i -= 1
+            else:
+                picked[count] = i - 1
+                count += 1
+                j -= expense_cents[i - 1]
+                i -= 1
+
+        return True, picked[:count]
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """Count the set bits of each value in an array of non-negative integers"""
+    if hasattr(np, "bitwise_count"):  # NumPy 2.0+
+        return np.bitwise_count(values).astype(np.int64)
+
+    as_bytes = values.astype(np.uint64).view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(as_bytes, axis=1).sum(axis=1, dtype=np.int64)
+
+
+class _LazyDiscrepancies(Sequence):
+    """Discrepancy records of unbalanced matches, built only when accessed"""
+
+    def __init__(self, matches: List[Dict], entries: List[Tuple]):
+        """
+        Args:
+            matches: List of matched groups
+            entries: (match_index, balance, revenue_amount, expense_total) tuples
+        """
+        self._matches = matches
+        self._entries = entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        match_index, balance, revenue_amount, expense_total = self._entries[index]
+        return {
+            "match": self._matches[match_index],
+            "balance": balance,
+            "revenue_amount": revenue_amount,
+            "expense_total": expense_total,
+        }
 
 
 class BalanceCalculator:
@@ -21,6 +141,7 @@ class BalanceCalculator:
         """
         self.config = config
         self.balance_tolerance = config.BALANCE_TOLERANCE
+        self.use_numba = NUMBA_AVAILABLE and getattr(config, "USE_NUMBA", False)
 
     def calculate_match_balance(self, match: Dict) -> float:
         """
@@ -32,17 +153,34 @@ class BalanceCalculator:
         Returns:
             Balance amount (should be close to 0 for valid matches)
         """
-        revenue = match.get("revenue", {})
-        expenses = match.get("expenses", [])
-
-        revenue_amount = revenue.get("amount", 0)
-        expense_total = sum(exp.get("amount", 0) for exp in expenses)
+        revenue_amount, expense_amounts = self._match_amounts(match)
 
         # Balance = revenue + expenses (expenses are negative)
-        balance = revenue_amount + expense_total
+        balance = revenue_amount + float(expense_amounts.sum())
 
         return balance
 
+    def _match_amounts(self, match: Dict) -> Tuple[float, np.ndarray]:
+        """
+        Extract the signed amounts of a matched group in one pass
+
+        Args:
+            match: Dictionary containing revenue and expenses
+
+        Returns:
+            Tuple of (revenue_amount, expense_amounts array)
+        """
+        revenue = match.get("revenue") or {}
+        expenses = match.get("expenses", [])
+
+        expense_amounts = np.fromiter(
+            (exp.get("amount", 0) for exp in expenses),
+            dtype=np.float64,
+            count=len(expenses),
+        )
+
+        return revenue.get("amount", 0), expense_amounts
+
     def is_balanced(self, match: Dict) -> bool:
         """
         Check if a matched group is balanced (sums to zero within tolerance)
@@ -78,8 +216,8 @@ class BalanceCalculator:
             return False, "No expense transactions in match"
 
         # Check if balanced
-        if not self.is_balanced(match):
-            balance = self.calculate_match_balance(match)
+        balance = self.calculate_match_balance(match)
+        if abs(balance) >= self.balance_tolerance:
             return False, f"Match not balanced. Balance: {balance:.2f}"
 
         return True, "Match is valid"
@@ -96,19 +234,215 @@ class BalanceCalculator:
             max_combo_size: Maximum number of expenses in a combination
 
         Returns:
-            List of expense combinations that match the target
+            List of expense combinations that match the target, ordered by size
+            and then by position in expenses
+        """
+        return list(
+            self.iter_expense_combinations(target_amount, expenses, max_combo_size)
+        )
+
+    def iter_expense_combinations(
+        self, target_amount: float, expenses: List[Dict], max_combo_size: int = 10
+    ) -> Iterator[List[Dict]]:
         """
-        matching_combinations = []
+        Yield expense combinations that sum to target amount, smallest first
 
-        # Try combinations of different sizes
-        for size in range(1, min(max_combo_size + 1, len(expenses) + 1)):
-            for combo in combinations(expenses, size):
-                combo_sum = sum(abs(exp.get("amount", 0)) for exp in combo)
+        Uses a meet-in-the-middle search: subset sums of each half of the
+        expenses are enumerated with NumPy and joined with a sorted search, so
+        the work grows with 2^(n/2) rather than 2^n. Hits are checked and
+        yielded one combination size at a time, so a caller that stops early
+        skips the larger sizes.
 
+        Args:
+            target_amount: Target amount to match (positive value)
+            expenses: List of expense dictionaries
+            max_combo_size: Maximum number of expenses in a combination
+
+        Yields:
+            Matching expense combinations, ordered by size and then by position
+            in expenses
+        """
+        n = len(expenses)
+        max_size = min(max_combo_size, n)
+        if max_size < 1:
+            return
+
+        amounts = self._to_abs_array(expenses)
+        values = amounts.tolist()
+
+        half = n // 2
+
+        # Each half is tracked with uint64 bitmasks and held in memory at once
+        half_subsets = sum(comb(n - half, k) for k in range(max_size + 1))
+        if n > 128 or half_subsets > MAX_HALF_SUBSETS:
+            yield from self._iter_expense_combinations_exhaustive(
+                target_amount, expenses, amounts, max_size
+            )
+            return
+
+        # Amounts are non-negative, so a partial sum past the target window can
+        # only grow; such subsets are pruned while enumerating each half
+        slack = 1e-9 * max(1.0, float(np.nansum(amounts)))
+        window = self.balance_tolerance + slack
+        limit = target_amount + window
+
+        left_sums, left_masks = self._subset_sums(amounts[:half], max_size, limit)
+        right_sums, right_masks = self._subset_sums(amounts[half:], max_size, limit)
+
+        order = np.argsort(left_sums, kind="stable")
+        left_sums = left_sums[order]
+        left_masks = left_masks[order]
+
+        # The window is widened slightly for summation-order rounding; every
+        # candidate is re-checked exactly below
+        remainder = target_amount - right_sums
+        lo = np.searchsorted(left_sums, remainder - window, side="left")
+        hi = np.searchsorted(left_sums, remainder + window, side="right")
+
+        counts = hi - lo
+        right_idx = np.repeat(np.arange(len(right_sums)), counts)
+        starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        left_idx = np.arange(len(right_idx)) + starts
+        left_masks = left_masks[left_idx]
+        right_masks = right_masks[right_idx]
+        sizes = _popcount(left_masks) + _popcount(right_masks)
+
+        for size in range(1, max_size + 1):
+            selected = sizes == size
+            if not selected.any():
+                continue
+
+            found = []
+            for left_mask, right_mask in zip(
+                left_masks[selected].tolist(),
+                right_masks[selected].tolist(),
+            ):
+                indices = [k for k in range(half) if left_mask >> k & 1]
+                indices.extend(half + k for k in range(n - half) if right_mask >> k & 1)
+
+                combo_sum = sum(values[k] for k in indices)
                 if abs(combo_sum - target_amount) < self.balance_tolerance:
-                    matching_combinations.append(list(combo))
+                    found.append(indices)
+
+            # Same order as enumerating itertools.combinations by size
+            found.sort()
+            for indices in found:
+                yield [expenses[k] for k in indices]
 
-        return matching_combinations
+    def _subset_sums(
+        self, amounts: np.ndarray, max_size: int, limit: float = np.inf
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Enumerate sums of all subsets of amounts with at most max_size items
+
+        Args:
+            amounts: Non-negative amounts (at most 64)
+            max_size: Maximum number of items in a subset
+            limit: Subsets summing above this are dropped, along with every
+                superset of them
+
+        Returns:
+            Tuple of (sums, bitmasks), one entry per subset including the
+            empty one
+        """
+        level_sums = np.zeros(1, dtype=np.float64)
+        level_masks = np.zeros(1, dtype=np.uint64)
+        level_last = np.full(1, -1, dtype=np.int64)
+
+        all_sums = [level_sums]
+        all_masks = [level_masks]
+
+        # Build subsets of size k + 1 by appending an item after the last one
+        for _ in range(min(max_size, len(amounts))):
+            next_sums, next_masks, next_last = [], [], []
+            for j in range(len(amounts)):
+                extend = (level_last < j) & (level_sums + amounts[j] <= limit)
+                if not extend.any():
+                    continue
+                next_sums.append(level_sums[extend] + amounts[j])
+                next_masks.append(level_masks[extend] | np.uint64(1 << j))
+                next_last.append(np.full(int(extend.sum()), j, dtype=np.int64))
+
+            if not next_sums:
+                break
+
+            level_sums = np.concatenate(next_sums)
+            level_masks = np.concatenate(next_masks)
+            level_last = np.concatenate(next_last)
+
+            all_sums.append(level_sums)
+            all_masks.append(level_masks)
+
+        return np.concatenate(all_sums), np.concatenate(all_masks)
+
+    def _iter_expense_combinations_exhaustive(
+        self,
+        target_amount: float,
+        expenses: List[Dict],
+        amounts: np.ndarray,
+        max_size: int,
+    ) -> Iterator[List[Dict]]:
+        """
+        Branch-and-bound search over expense combinations (fallback for lists
+        too long for the meet-in-the-middle search)
+
+        Expenses are visited largest first with suffix sums, so a branch is cut
+        as soon as it overshoots the target or can no longer reach it. Each
+        combination size is searched separately so results stream in order.
+
+        Args:
+            target_amount: Target amount to match (positive value)
+            expenses: List of expense dictionaries
+            amounts: Absolute expense amounts
+            max_size: Maximum number of expenses in a combination
+
+        Yields:
+            Matching expense combinations, ordered by size and then by position
+            in expenses
+        """
+        values = amounts.tolist()
+        order = np.argsort(-amounts, kind="stable").tolist()
+        order = [k for k in order if not np.isnan(values[k])]
+        sorted_values = [values[k] for k in order]
+
+        suffix = [0.0] * (len(order) + 1)
+        for pos in range(len(order) - 1, -1, -1):
+            suffix[pos] = suffix[pos + 1] + sorted_values[pos]
+
+        slack = 1e-9 * max(1.0, suffix[0])
+        low = target_amount - self.balance_tolerance - slack
+        high = target_amount + self.balance_tolerance + slack
+
+        chosen = []
+
+        def search(start: int, partial: float, size: int, found: List) -> None:
+            if len(chosen) == size:
+                if partial >= low:
+                    indices = sorted(chosen)
+                    combo_sum = sum(values[k] for k in indices)
+                    if abs(combo_sum - target_amount) < self.balance_tolerance:
+                        found.append(indices)
+                return
+
+            for pos in range(start, len(order)):
+                # Remaining items are smaller, so the target is out of reach
+                if partial + suffix[pos] < low:
+                    break
+                if partial + sorted_values[pos] > high:
+                    continue
+
+                chosen.append(order[pos])
+                search(pos + 1, partial + sorted_values[pos], size, found)
+                chosen.pop()
+
+        for size in range(1, max_size + 1):
+            found = []
+            search(0, 0.0, size, found)
+
+            # Same order as enumerating itertools.combinations by size
+            found.sort()
+            for indices in found:
+                yield [expenses[k] for k in indices]
 
     def find_expense_combinations_dp(
         self, target_amount: float, expenses: List[Dict]
@@ -125,31 +459,31 @@ class BalanceCalculator:
         """
         # Convert to cents to avoid floating point issues
         target_cents = int(round(target_amount * 100))
-        expense_cents = [
-            int(round(abs(exp.get("amount", 0)) * 100)) for exp in expenses
-        ]
+        expense_cents = self._cents_of(expenses)
 
         n = len(expenses)
+        if target_cents <= 0:
+            return None
 
-        # DP table: dp[i][j] = can we make amount j using first i expenses?
-        dp = [[False] * (target_cents + 1) for _ in range(n + 1)]
-
-        # Base case: 0 amount is always possible
-        for i in range(n + 1):
-            dp[i][0] = True
-
-        # Fill DP table
-        for i in range(1, n + 1):
-            for j in range(target_cents + 1):
-                # Don't take current expense
-                dp[i][j] = dp[i - 1][j]
-
-                # Take current expense if possible
-                if j >= expense_cents[i - 1]:
-                    dp[i][j] = dp[i][j] or dp[i - 1][j - expense_cents[i - 1]]
+        if self.use_numba:
+            found, picked = _subset_sum_kernel(expense_cents, target_cents)
+            if not found or len(picked) == 0:
+                return None
+            return [expenses[k] for k in picked.tolist()]
+
+        # rows[i] holds the sums reachable with the first i expenses, as a
+        # bit-packed uint64 row of a single preallocated 2-D table
+        nwords = target_cents // 64 + 1
+        rows = np.zeros((n + 1, nwords), dtype=np.uint64)
+        rows[0, 0] = 1
+
+        for i, cents in enumerate(expense_cents.tolist(), start=1):
+            np.bitwise_or(
+                rows[i - 1], self._shift_bits(rows[i - 1], cents), out=rows[i]
+            )
 
         # Check if solution exists
-        if not dp[n][target_cents]:
+        if not self._test_bit(rows[n], target_cents):
             return None
 
         # Backtrack to find the actual combination
@@ -158,16 +492,78 @@ class BalanceCalculator:
 
         while i > 0 and j > 0:
             # If value came from not taking current item, move up
-            if dp[i - 1][j]:
+            if self._test_bit(rows[i - 1], j):
                 i -= 1
             else:
                 # Current item was taken
                 result.append(expenses[i - 1])
-                j -= expense_cents[i - 1]
+                j -= int(expense_cents[i - 1])
                 i -= 1
 
         return result if result else None
 
+    @staticmethod
+    def _to_abs_array(expenses: List[Dict]) -> np.ndarray:
+        """
+        Collect the absolute amounts of a list of transactions
+
+        Args:
+            expenses: List of expense dictionaries
+
+        Returns:
+            float64 array of absolute amounts, in list order
+        """
+        amounts = np.fromiter(
+            (exp.get("amount", 0) for exp in expenses),
+            dtype=np.float64,
+            count=len(expenses),
+        )
+        return np.abs(amounts)
+
+    def _cents_of(self, expenses: List[Dict]) -> np.ndarray:
+        """
+        Convert absolute expense amounts to whole cents in one vectorized pass
+
+        Args:
+            expenses: List of expense dictionaries
+
+        Returns:
+            int64 array of cents (rounded half to even, like round())
+        """
+        return np.rint(self._to_abs_array(expenses) * 100).astype(np.int64)
+
+    @staticmethod
+    def _shift_bits(words: np.ndarray, shift: int) -> np.ndarray:
+        """
+        Shift a bit-packed uint64 array towards higher bit positions
+
+        Args:
+            words: Bitset stored as little-endian uint64 words
+            shift: Number of bit positions to shift by
+
+        Returns:
+            New shifted bitset of the same length (overflowing bits are dropped)
+        """
+        nwords = len(words)
+        word_shift, bit_shift = divmod(shift, 64)
+        shifted = np.zeros(nwords, dtype=np.uint64)
+        if word_shift >= nwords:
+            return shifted
+
+        source = words[: nwords - word_shift]
+        if bit_shift == 0:
+            shifted[word_shift:] = source
+        else:
+            shifted[word_shift:] = source << np.uint64(bit_shift)
+            shifted[word_shift + 1 :] |= source[:-1] >> np.uint64(64 - bit_shift)
+
+        return shifted
+
+    @staticmethod
+    def _test_bit(words: np.ndarray, bit: int) -> bool:
+        """Check whether a bit is set in a bit-packed uint64 array"""
+        return bool((int(words[bit // 64]) >> (bit % 64)) & 1)
+
     def calculate_total_balance(self, matches: List[Dict]) -> Dict:
         """
         Calculate overall balance statistics for all matches
@@ -188,30 +584,41 @@ class BalanceCalculator:
             "balance_discrepancies": [],
         }
 
-        for match in matches:
-            revenue = match.get("revenue", {})
-            expenses = match.get("expenses", [])
-
-            revenue_amount = abs(revenue.get("amount", 0))
-            expense_total = sum(abs(exp.get("amount", 0)) for exp in expenses)
-
-            stats["total_revenue"] += revenue_amount
-            stats["total_expenses"] += expense_total
-
-            balance = self.calculate_match_balance(match)
-
-            if self.is_balanced(match):
-                stats["balanced_matches"] += 1
-            else:
-                stats["unbalanced_matches"] += 1
-                stats["balance_discrepancies"].append(
-                    {
-                        "match": match,
-                        "balance": balance,
-                        "revenue_amount": revenue_amount,
-                        "expense_total": expense_total,
-                    }
+        if not matches:
+            return stats
+
+        # Flat layout: one revenue slot followed by the expenses of each match
+        amounts, _, offsets = self._matches_to_csr(matches)
+        starts = offsets[:-1]
+
+        revenue_amounts = np.abs(amounts[starts])
+        expense_abs = np.abs(amounts)
+        expense_abs[starts] = 0.0
+        expense_totals = np.add.reduceat(expense_abs, starts)
+        balances = np.add.reduceat(amounts, starts)
+
+        balanced_mask = np.abs(balances) < self.balance_tolerance
+        balanced_count = int(balanced_mask.sum())
+
+        stats["balanced_matches"] = balanced_count
+        stats["unbalanced_matches"] = len(matches) - balanced_count
+        stats["total_revenue"] = float(revenue_amounts.sum())
+        stats["total_expenses"] = float(expense_totals.sum())
+
+        # Only unbalanced matches need per-match detail; the records are built
+        # when the list is read
+        unbalanced = np.flatnonzero(~balanced_mask)
+        stats["balance_discrepancies"] = _LazyDiscrepancies(
+            matches,
+            list(
+                zip(
+                    unbalanced.tolist(),
+                    balances[unbalanced].tolist(),
+                    revenue_amounts[unbalanced].tolist(),
+                    expense_totals[unbalanced].tolist(),
                 )
+            ),
+        )
 
         stats["net_balance"] = stats["total_revenue"] - stats["total_expenses"]
 
@@ -233,13 +640,16 @@ class BalanceCalculator:
         """
         suggestions = []
 
-        # Find exact matches first
-        exact_combinations = self.find_expense_combinations(
-            revenue_amount, available_expenses, max_combo_size=5
+        # Find exact matches first, stopping the search once top_n are found
+        exact_combinations = islice(
+            self.iter_expense_combinations(
+                revenue_amount, available_expenses, max_combo_size=5
+            ),
+            top_n,
         )
 
-        for combo in exact_combinations[:top_n]:
-            combo_sum = sum(abs(exp.get("amount", 0)) for exp in combo)
+        for combo in exact_combinations:
+            combo_sum = float(self._to_abs_array(combo).sum())
             suggestions.append(
                 {
                     "expenses": combo,
@@ -274,34 +684,64 @@ class BalanceCalculator:
             List of close matches sorted by proximity
         """
         close_matches = []
+        if top_n <= 0:
+            return close_matches
 
         # Try combinations of different sizes (limit to avoid performance issues)
         max_expenses = min(10, len(expenses))
+        max_size = min(5, max_expenses)
+        values = self._to_abs_array(expenses[:max_expenses])
+
+        # One row per subset bitmask; bits[m, k] is set if expense k is in m
+        masks = np.arange(1 << max_expenses)
+        bits = (masks[:, None] >> np.arange(max_expenses)) & 1
+        sizes = _popcount(masks)
+
+        # Add the amounts in index order so each sum matches a sequential sum
+        sums = np.zeros(len(masks), dtype=np.float64)
+        for k in range(max_expenses):
+            sums += np.where(bits[:, k] == 1, values[k], 0.0)
+
+        # Only consider if reasonably close (within 10%)
+        differences = np.abs(sums - target_amount)
+        candidates = np.flatnonzero(
+            (sizes >= 1) & (sizes <= max_size) & (differences < target_amount * 0.1)
+        )
+        if len(candidates) == 0:
+            return close_matches
 
-        for size in range(1, min(6, max_expenses + 1)):
-            for combo in combinations(expenses[:max_expenses], size):
-                combo_sum = sum(abs(exp.get("amount", 0)) for exp in combo)
-                difference = abs(combo_sum - target_amount)
+        scores = np.maximum(0, 1 - differences[candidates] / target_amount)
 
-                # Only consider if reasonably close (within 10%)
-                if difference < target_amount * 0.1:
-                    proximity_score = max(0, 1 - (difference / target_amount))
+        # Keep only candidates that can make the top_n (ties included)
+        if len(candidates) > top_n:
+            cutoff = np.partition(-scores, top_n - 1)[top_n - 1]
+            keep = -scores <= cutoff
+            candidates = candidates[keep]
+            scores = scores[keep]
 
-                    close_matches.append(
-                        {
-                            "expenses": list(combo),
-                            "total_amount": combo_sum,
-                            "balance": target_amount - combo_sum,
-                            "match_type": "approximate",
-                            "score": proximity_score,
-                            "difference": difference,
-                        }
-                    )
+        # Rank by score, then in itertools.combinations order: by size, then
+        # lexicographically, which is descending order of the bit-reversed mask
+        reversed_masks = bits[candidates] @ (1 << np.arange(max_expenses)[::-1])
+        ranking = np.lexsort((-reversed_masks, sizes[candidates], -scores))
 
-        # Sort by score (best matches first)
-        close_matches.sort(key=lambda x: x["score"], reverse=True)
+        for pos in ranking[:top_n].tolist():
+            mask = int(candidates[pos])
+            combo_sum = float(sums[mask])
 
-        return close_matches[:top_n]
+            close_matches.append(
+                {
+                    "expenses": [
+                        expenses[k] for k in range(max_expenses) if mask >> k & 1
+                    ],
+                    "total_amount": combo_sum,
+                    "balance": target_amount - combo_sum,
+                    "match_type": "approximate",
+                    "score": float(scores[pos]),
+                    "difference": float(differences[mask]),
+                }
+            )
+
+        return close_matches
 
     def group_by_match_status(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
@@ -313,10 +753,14 @@ class BalanceCalculator:
         Returns:
             Dictionary of DataFrames grouped by status
         """
+        # Split on the status column in a single pass
+        parts = dict(iter(df.groupby("match_status", sort=False, observed=True)))
+        empty = df.iloc[0:0]
+
         grouped = {
-            "matched": df[df["match_status"] == "matched"],
-            "unmatched": df[df["match_status"] == "unmatched"],
-            "pending": df[df["match_status"] == "pending_review"],
+            "matched": parts.get("matched", empty),
+            "unmatched": parts.get("unmatched", empty),
+            "pending": parts.get("pending_review", empty),
         }
 
         return grouped
@@ -366,12 +810,28 @@ class BalanceCalculator:
         valid_matches = []
         invalid_matches = []
 
-        for match in matches:
-            is_valid, message = self.validate_match(match)
+        if not matches:
+            return valid_matches, invalid_matches
+
+        amounts, _, offsets = self._matches_to_csr(matches)
+        if self.use_numba:
+            balanced = self.validate_all_matches_numba(
+                amounts, offsets, tolerance=self.balance_tolerance
+            )
+        else:
+            balances = np.add.reduceat(amounts, offsets[:-1])
+            balanced = np.abs(balances) < self.balance_tolerance
+
+        has_revenue = np.array([bool(m.get("revenue")) for m in matches], dtype=bool)
+        has_expenses = np.array([bool(m.get("expenses")) for m in matches], dtype=bool)
+        valid_mask = balanced & has_revenue & has_expenses
 
+        for match, is_valid in zip(matches, valid_mask.tolist()):
             if is_valid:
                 valid_matches.append(match)
             else:
+                # Only failing matches pay for the Python validation message
+                is_valid, message = self.validate_match(match)
                 match["validation_error"] = message
                 invalid_matches.append(match)
 
@@ -402,32 +862,244 @@ class BalanceCalculator:
         Returns:
             Updated DataFrame with match group assignments
         """
-        df_copy = df.copy()
-        
+        # Only the match columns are written, so share every other column with
+        # df and give the result its own copies of those three
+        df_copy = df.copy(deep=False)
+        for col in ("match_status", "match_confidence"):
+            if col in df_copy.columns:
+                df_copy[col] = df_copy[col].copy()
+
         # Ensure match_group_id column has correct dtype to avoid FutureWarning
         if "match_group_id" in df_copy.columns:
             df_copy["match_group_id"] = df_copy["match_group_id"].astype(object)
 
+        if not matches:
+            return self._categorize_match_columns(df_copy)
+
+        # Format every group ID once; rows refer to them by match number
+        group_ids = np.array(
+            [self.calculate_match_group_id(idx) for idx in range(len(matches))],
+            dtype=object,
+        )
+
+        if self.use_numba:
+            df_copy = self._assign_match_groups_numba(df_copy, matches, group_ids)
+            return self._categorize_match_columns(df_copy)
+
+        # Collect the writes, then apply each column in one bulk assignment
+        idx_buf = []
+        gid_buf = []
+        conf_buf = []
+
         for idx, match in enumerate(matches):
-            match_group_id = self.calculate_match_group_id(idx)
             confidence = match.get("confidence", 0.0)
 
-            # Update revenue transaction
             revenue = match.get("revenue", {})
-            if revenue:
-                rev_idx = revenue.get("original_index")
-                if rev_idx is not None and rev_idx in df_copy.index:
-                    df_copy.at[rev_idx, "match_status"] = "matched"
-                    df_copy.at[rev_idx, "match_group_id"] = str(match_group_id)
-                    df_copy.at[rev_idx, "match_confidence"] = confidence
-
-            # Update expense transactions
-            expenses = match.get("expenses", [])
-            for expense in expenses:
+            row_indices = [revenue.get("original_index")] if revenue else []
+            row_indices.extend(
+                expense.get("original_index") for expense in match.get("expenses", [])
+            )
+
+            for row_idx in row_indices:
+                if row_idx is not None:
+                    idx_buf.append(row_idx)
+                    gid_buf.append(idx)
+                    conf_buf.append(confidence)
+
+        if not idx_buf:
+            return self._categorize_match_columns(df_copy)
+
+        positions = df_copy.index.get_indexer(idx_buf)
+        found = np.flatnonzero(positions >= 0)
+
+        # A row listed in several matches keeps the last assignment
+        _, last = np.unique(positions[found][::-1], return_index=True)
+        found = found[len(found) - 1 - last]
+
+        rows = positions[found]
+        columns = df_copy.columns
+        df_copy.iloc[rows, columns.get_loc("match_status")] = "matched"
+        df_copy.iloc[rows, columns.get_loc("match_group_id")] = group_ids[
+            np.array(gid_buf, dtype=np.int64)[found]
+        ]
+        df_copy.iloc[rows, columns.get_loc("match_confidence")] = np.array(
+            conf_buf, dtype=np.float64
+        )[found]
+
+        return self._categorize_match_columns(df_copy)
+
+    def _categorize_match_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store match_status and match_group_id as categoricals
+
+        Both columns hold a handful of repeated strings, so integer codes make
+        them much smaller and turn status filters into code comparisons.
+
+        Args:
+            df: DataFrame with transactions (modified in place)
+
+        Returns:
+            The updated DataFrame
+        """
+        if "match_status" in df.columns:
+            status = df["match_status"].astype("category")
+            missing = [c for c in MATCH_STATUSES if c not in status.cat.categories]
+            df["match_status"] = status.cat.add_categories(missing)
+
+        if "match_group_id" in df.columns:
+            df["match_group_id"] = df["match_group_id"].astype("category")
+
+        return df
+
+    def validate_all_matches_numba(
+        self, amounts: np.ndarray, offsets: np.ndarray, tolerance: float
+    ) -> np.ndarray:
+        """
+        Check which matches are balanced using the Numba kernel
+
+        Args:
+            amounts: Signed amounts of all matches, revenue first (CSR values)
+            offsets: Start offset of each match in amounts, plus the end offset
+            tolerance: Balance tolerance
+
+        Returns:
+            Boolean array, True where the match sums to zero within tolerance
+        """
+        return _balanced_mask_kernel(amounts, offsets, tolerance)
+
+    def _matches_to_csr(
+        self, matches: List[Dict]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Flatten matches into a CSR-style ragged layout
+
+        Each match occupies one slot for its revenue followed by one slot per
+        expense. Missing revenues contribute an amount of 0 and missing
+        original indices are stored as -1.
+
+        Args:
+            matches: List of matched groups
+
+        Returns:
+            Tuple of (amounts, original_indices, offsets)
+        """
+        amounts = []
+        indices = []
+        offsets = [0]
+
+        for match in matches:
+            revenue = match.get("revenue") or {}
+            amounts.append(revenue.get("amount", 0))
+            rev_idx = revenue.get("original_index")
+            indices.append(-1 if rev_idx is None else rev_idx)
+
+            for expense in match.get("expenses", []):
+                amounts.append(expense.get("amount", 0))
                 exp_idx = expense.get("original_index")
-                if exp_idx is not None and exp_idx in df_copy.index:
-                    df_copy.at[exp_idx, "match_status"] = "matched"
-                    df_copy.at[exp_idx, "match_group_id"] = match_group_id
-                    df_copy.at[exp_idx, "match_confidence"] = confidence
+                indices.append(-1 if exp_idx is None else exp_idx)
+
+            offsets.append(len(amounts))
+
+        return (
+            np.asarray(amounts, dtype=np.float64),
+            np.asarray(indices, dtype=np.int64),
+            np.asarray(offsets, dtype=np.int64),
+        )
+
+    def _assign_match_groups_numba(
+        self, df_copy: pd.DataFrame, matches: List[Dict], group_ids: np.ndarray
+    ) -> pd.DataFrame:
+        """
+        Numba path of assign_match_groups: resolve every row's match with one
+        kernel call and write the three match columns in bulk
+
+        Args:
+            df_copy: Copy of the transactions DataFrame (modified in place)
+            matches: List of matched groups
+            group_ids: Match group ID of each match (object array)
+
+        Returns:
+            Updated DataFrame with match group assignments
+        """
+        _, indices, offsets = self._matches_to_csr(matches)
+        positions = df_copy.index.get_indexer(indices)
+        groups = _group_rows_kernel(positions, offsets, len(df_copy))
+
+        rows = np.flatnonzero(groups >= 0)
+        row_groups = groups[rows]
+
+        confidences = np.array(
+            [match.get("confidence", 0.0) for match in matches], dtype=np.float64
+        )
+
+        columns = df_copy.columns
+        df_copy.iloc[rows, columns.get_loc("match_status")] = "matched"
+        df_copy.iloc[rows, columns.get_loc("match_group_id")] = group_ids[row_groups]
+        df_copy.iloc[rows, columns.get_loc("match_confidence")] = confidences[
+            row_groups
+        ]
 
         return df_copy
+
+    def assign_match_group(
+        self, df: pd.DataFrame, match: Dict, match_index: int
+    ) -> pd.DataFrame:
+        """
+        Assign a single match group, updating only the rows in that match
+
+        Works on a shallow copy whose three match columns get their own
+        storage, so df itself is never modified (with or without pandas'
+        copy-on-write) and the other columns are not copied, instead of
+        rewriting every row as assign_match_groups does.
+
+        Args:
+            df: DataFrame with transactions
+            match: Matched group to assign
+            match_index: Index of the match in the full list of matches
+
+        Returns:
+            Updated copy of the DataFrame
+        """
+        df = df.copy(deep=False)
+        row_indices = []
+
+        revenue = match.get("revenue", {})
+        if revenue:
+            row_indices.append(revenue.get("original_index"))
+
+        for expense in match.get("expenses", []):
+            row_indices.append(expense.get("original_index"))
+
+        # Resolve labels to positions once and write only those slots
+        positions = df.index.get_indexer(
+            [idx for idx in row_indices if idx is not None]
+        )
+        positions = positions[positions >= 0]
+        if len(positions) == 0:
+            return df
+
+        match_group_id = self.calculate_match_group_id(match_index)
+
+        # Copy the columns written below so df's blocks are never shared
+        for col in ("match_status", "match_group_id", "match_confidence"):
+            df[col] = df[col].copy()
+
+        # Categorical columns only accept values that are already categories
+        for col, value in (
+            ("match_status", "matched"),
+            ("match_group_id", match_group_id),
+        ):
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                if value not in df[col].cat.categories:
+                    df[col] = df[col].cat.add_categories([value])
+            elif col == "match_group_id" and df[col].dtype != object:
+                df[col] = df[col].astype(object)
+
+        status_col, group_col, confidence_col = df.columns.get_indexer(
+            ["match_status", "match_group_id", "match_confidence"]
+        )
+        df.iloc[positions, status_col] = "matched"
+        df.iloc[positions, group_col] = match_group_id
+        df.iloc[positions, confidence_col] = match.get("confidence", 0.0)
+
+        return df
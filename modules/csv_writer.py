@@ -0,0 +1,92 @@
+"""
+CSV Writer Module
+Writes DataFrames to CSV, through Polars' multi-threaded writer when installed
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional
+from pandas.api.types import (
+    infer_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_string_dtype,
+)
+
+try:
+    import polars as pl
+
+    POLARS_AVAILABLE = True
+except ImportError:  # polars is optional for writing
+    POLARS_AVAILABLE = False
+
+# Python writes floats below this magnitude in scientific notation; Polars
+# does not, so such columns stay on the pandas writer
+SCIENTIFIC_THRESHOLD = 1e-4
+
+
+def write_csv(
+    df: pd.DataFrame,
+    output_path: str,
+    fast: bool = True,
+    chunksize: Optional[int] = None,
+):
+    """
+    Write a DataFrame to CSV without its index
+
+    Polars is only used when it produces the same text as DataFrame.to_csv,
+    i.e. for integer, float and string columns; anything else (dates,
+    booleans, mixed objects) goes through pandas.
+
+    Args:
+        df: DataFrame to write
+        output_path: Path of the CSV file
+        fast: Use Polars when it is installed and the columns allow it
+        chunksize: Rows formatted and written per batch, bounding the text
+            held in memory; each writer's default when not given
+    """
+    if fast and POLARS_AVAILABLE and _polars_compatible(df):
+        frame = pl.from_pandas(df)
+        # pandas writes empty strings as empty fields, Polars quotes them
+        frame = frame.with_columns(pl.col(pl.String).replace("", None))
+        if chunksize:
+            frame.write_csv(output_path, batch_size=chunksize)
+        else:
+            frame.write_csv(output_path)
+    else:
+        df.to_csv(output_path, index=False, chunksize=chunksize)
+
+
+def _polars_compatible(df: pd.DataFrame) -> bool:
+    """
+    Check whether Polars writes every column exactly like pandas
+
+    Args:
+        df: DataFrame to check
+
+    Returns:
+        True if the DataFrame can go through Polars
+    """
+    if not df.columns.is_unique or not all(isinstance(c, str) for c in df.columns):
+        return False
+
+    for _, column in df.items():
+        dtype = column.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            if infer_dtype(dtype.categories, skipna=True) not in ("string", "empty"):
+                return False
+        elif is_integer_dtype(dtype):
+            continue
+        elif is_float_dtype(dtype):
+            if dtype != np.float64:
+                return False
+            values = np.abs(column.to_numpy(dtype=np.float64, na_value=np.nan))
+            if ((values > 0) & (values < SCIENTIFIC_THRESHOLD)).any():
+                return False
+        elif is_string_dtype(dtype):
+            if infer_dtype(column, skipna=True) not in ("string", "empty"):
+                return False
+        else:
+            return False
+
+    return True
@@ -3,12 +3,51 @@ Entity Matcher Module
 Handles entity matching algorithms for reconciliation
 """
 
+import bisect
+import heapq
+import math
 import re
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, FrozenSet, List, Tuple, Optional, Set
+import numpy as np
 import pandas as pd
-from fuzzywuzzy import fuzz, process
+from rapidfuzz import fuzz, process, utils
 from collections import defaultdict
-import itertools
+from collections.abc import Sequence
+
+# Patterns used by the extract_* helpers, compiled once at import
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_COMPANY_RE = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b")
+_AMOUNT_RE = re.compile(r"\d+(?:,\d{3})*(?:\.\d{2})?")
+
+# Lowercases ASCII text and blanks out what _NON_WORD_RE would, in one pass
+_KEYWORD_TABLE = str.maketrans(
+    {chr(c): " " if _NON_WORD_RE.match(chr(c)) else chr(c).lower() for c in range(128)}
+)
+
+# Revenue rows scored per process.cdist call in fuzzy_match and review items
+_CDIST_BLOCK_ROWS = 1024
+
+
+class _LazyRecords(Sequence):
+    """Row records of a DataFrame, each built as a dict only when accessed"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: DataFrame whose rows are exposed as records
+        """
+        self._columns = df.columns.tolist()
+        self._values = [df.iloc[:, i].tolist() for i in range(len(self._columns))]
+        self._length = len(df)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return dict(zip(self._columns, [values[index] for values in self._values]))
 
 
 class EntityMatcher:
@@ -22,10 +61,17 @@ class EntityMatcher:
             config: Application configuration object
         """
         self.config = config
-        self.stopwords = set(config.STOPWORDS)
+        self.stopwords = frozenset(config.STOPWORDS)
         self.fuzzy_threshold = config.FUZZY_MATCH_THRESHOLD
+        # Smallest whole-percent score that reaches fuzzy_threshold, so the
+        # threshold can be compared in RapidFuzz's 0-100 integer space
+        self._fuzzy_threshold_i = math.ceil(round(self.fuzzy_threshold * 100, 6))
         self.high_confidence_threshold = config.HIGH_CONFIDENCE_THRESHOLD
         self.keyword_min_length = config.KEYWORD_MIN_LENGTH
+        self.fuzzy_workers = getattr(config, "FUZZY_WORKERS", -1)
+
+        # Keywords by original_index, stored with the text they came from
+        self._keyword_cache: Dict[int, Tuple[str, FrozenSet[str]]] = {}
 
     def extract_keywords(self, text: str) -> Set[str]:
         """
@@ -37,14 +83,15 @@ class EntityMatcher:
         Returns:
             Set of extracted keywords
         """
-        if pd.isna(text) or not isinstance(text, str):
+        if not isinstance(text, str) or not text:
             return set()
 
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove special characters but keep spaces
-        text = re.sub(r"[^\w\s]", " ", text)
+        # Convert to lowercase and remove special characters but keep spaces;
+        # the regex is only needed for non-ASCII text
+        if text.isascii():
+            text = text.translate(_KEYWORD_TABLE)
+        else:
+            text = _NON_WORD_RE.sub(" ", text.lower())
 
         # Split into words
         words = text.split()
@@ -68,12 +115,11 @@ class EntityMatcher:
         Returns:
             List of potential company names
         """
-        if pd.isna(text) or not isinstance(text, str):
+        if not isinstance(text, str) or not text:
             return []
 
         # Pattern for capitalized words (potential company names)
-        pattern = r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b"
-        matches = re.findall(pattern, text)
+        matches = _COMPANY_RE.findall(text)
 
         return matches
 
@@ -87,12 +133,11 @@ class EntityMatcher:
         Returns:
             List of extracted amounts
         """
-        if pd.isna(text) or not isinstance(text, str):
+        if not isinstance(text, str) or not text:
             return []
 
         # Pattern for numbers with optional decimals and separators
-        pattern = r"\d+(?:,\d{3})*(?:\.\d{2})?"
-        matches = re.findall(pattern, text)
+        matches = _AMOUNT_RE.findall(text)
 
         amounts = []
         for match in matches:
@@ -116,17 +161,182 @@ class EntityMatcher:
         Returns:
             Similarity score between 0 and 1
         """
-        if pd.isna(text1) or pd.isna(text2):
-            return 0.0
+        # Only non-string values need the (slower) missing-value check
+        if not (isinstance(text1, str) and isinstance(text2, str)):
+            if pd.isna(text1) or pd.isna(text2):
+                return 0.0
 
         # Use token sort ratio for better matching with word order variations
-        score = fuzz.token_sort_ratio(str(text1), str(text2))
+        score = fuzz.token_sort_ratio(
+            str(text1), str(text2), processor=utils.default_process
+        )
 
-        # Convert to 0-1 scale
-        return score / 100.0
+        # Round to a whole percentage like fuzzy_match, then convert to 0-1 scale
+        return round(score) / 100.0
+
+    def _keywords_for(self, idx: int, text: str) -> FrozenSet[str]:
+        """
+        Extract the keywords of a transaction, reusing earlier results
+
+        Args:
+            idx: original_index of the transaction
+            text: Description of the transaction
+
+        Returns:
+            Frozen set of extracted keywords
+        """
+        # The matcher outlives a single upload, so only reuse an entry when
+        # the row still has the same description
+        cached = self._keyword_cache.get(idx)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+
+        keywords = frozenset(self.extract_keywords(text))
+        self._keyword_cache[idx] = (text, keywords)
+        return keywords
+
+    def _precompute(
+        self, df: pd.DataFrame
+    ) -> Tuple[Dict[int, Tuple[str, FrozenSet[str], float]], np.ndarray]:
+        """
+        Precompute the text features of every transaction in a DataFrame once
+
+        Args:
+            df: DataFrame of transactions
+
+        Returns:
+            Tuple of (features keyed by original_index as (lowercased
+            description, keywords, absolute amount), absolute amounts in
+            row order)
+        """
+        abs_amounts = df["abs_amount"].to_numpy(dtype=np.float64)
+        features = {}
+
+        for idx, desc, amount in zip(
+            df["original_index"].tolist(), df["description"].tolist(), abs_amounts
+        ):
+            features[idx] = (
+                str(desc).lower().strip(),
+                self._keywords_for(idx, desc),
+                float(amount),
+            )
+
+        return features, abs_amounts
+
+    @staticmethod
+    def _keyword_postings(
+        ids: List[int], features: Dict[int, Tuple[str, FrozenSet[str], float]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Build an inverted index from each keyword to the rows that contain it
+
+        Args:
+            ids: original_index of each row, in row order
+            features: Features keyed by original_index from _precompute
+
+        Returns:
+            Dictionary mapping keywords to arrays of row positions
+        """
+        postings = defaultdict(list)
+        for pos, idx in enumerate(ids):
+            for keyword in features[idx][1]:
+                postings[keyword].append(pos)
+
+        return {keyword: np.array(pos) for keyword, pos in postings.items()}
+
+    @staticmethod
+    def _fuzzy_descs(df: pd.DataFrame) -> List[str]:
+        """
+        Normalize descriptions once for the rapidfuzz scorers
+
+        Args:
+            df: DataFrame of transactions
+
+        Returns:
+            Descriptions passed through rapidfuzz's default_process, in row
+            order
+        """
+        return [utils.default_process(str(desc)) for desc in df["description"]]
+
+    @staticmethod
+    def _fuzzy_comparable(descs: List[str]) -> np.ndarray:
+        """
+        Flag descriptions with enough text for fuzzy matching to be meaningful
+
+        Args:
+            descs: Descriptions normalized by _fuzzy_descs
+
+        Returns:
+            Boolean array, True where a description has at least two
+            non-numeric tokens
+        """
+        return np.array(
+            [sum(not token.isdigit() for token in desc.split()) >= 2 for desc in descs],
+            dtype=bool,
+        )
+
+    def _index_expenses(self, expenses: pd.DataFrame) -> Dict:
+        """
+        Collect the per-expense lookups find_potential_matches scores against
+
+        Args:
+            expenses: DataFrame of expense transactions
+
+        Returns:
+            Dictionary of features, row-ordered ids, normalized descriptions,
+            absolute amounts and keyword counts, and the keyword postings
+        """
+        features, abs_amounts = self._precompute(expenses)
+        ids = expenses["original_index"].tolist()
+
+        return {
+            "features": features,
+            "ids": ids,
+            "descs": self._fuzzy_descs(expenses),
+            "abs_amounts": abs_amounts,
+            "keyword_counts": np.array(
+                [len(features[idx][1]) for idx in ids], dtype=np.int64
+            ),
+            "postings": self._keyword_postings(ids, features),
+        }
+
+    def _exact_match_keys(
+        self, df: pd.DataFrame, features: Optional[Dict] = None
+    ) -> pd.DataFrame:
+        """
+        Build the join keys exact_match pairs transactions on
+
+        Args:
+            df: DataFrame of transactions
+            features: Features keyed by original_index from _precompute, to
+                reuse their lowercased descriptions
+
+        Returns:
+            DataFrame of row position, lowercased description, amount bucket
+            of width BALANCE_TOLERANCE and absolute amount
+        """
+        abs_amounts = df["abs_amount"].to_numpy(dtype=np.float64)
+        if features is None:
+            desc_lower = [str(desc).lower().strip() for desc in df["description"]]
+        else:
+            desc_lower = [features[idx][0] for idx in df["original_index"].tolist()]
+
+        return pd.DataFrame(
+            {
+                "pos": np.arange(len(df)),
+                "desc_lower": pd.Series(desc_lower, dtype=object),
+                "amount_key": np.rint(
+                    abs_amounts / self.config.BALANCE_TOLERANCE
+                ).astype(np.int64),
+                "abs_amount": abs_amounts,
+            }
+        )
 
     def exact_match(
-        self, expenses: pd.DataFrame, revenues: pd.DataFrame
+        self,
+        expenses: pd.DataFrame,
+        revenues: pd.DataFrame,
+        features: Optional[Dict] = None,
     ) -> Tuple[List[Dict], pd.DataFrame, pd.DataFrame]:
         """
         Perform exact matching between expenses and revenues
@@ -134,56 +344,72 @@ class EntityMatcher:
         Args:
             expenses: DataFrame of expense transactions
             revenues: DataFrame of revenue transactions
+            features: Features of both frames keyed by original_index from
+                _precompute, computed as needed when not given
 
         Returns:
             Tuple of (matches, remaining_expenses, remaining_revenues)
         """
         matches = []
-        matched_expense_ids = set()
-        matched_revenue_ids = set()
-
-        for _, revenue in revenues.iterrows():
-            revenue_amount = revenue["abs_amount"]
-            revenue_desc = str(revenue["description"]).lower().strip()
 
-            # Look for exact amount and description match
-            for _, expense in expenses.iterrows():
-                if expense["original_index"] in matched_expense_ids:
-                    continue
-
-                expense_amount = expense["abs_amount"]
-                expense_desc = str(expense["description"]).lower().strip()
+        tolerance = self.config.BALANCE_TOLERANCE
+        expense_keys = self._exact_match_keys(expenses, features)
+        revenue_keys = self._exact_match_keys(revenues, features)
+
+        # Amounts within tolerance of each other fall in the same or an
+        # adjacent bucket, so join each revenue against all three
+        candidates = pd.concat(
+            [
+                revenue_keys.assign(amount_key=revenue_keys["amount_key"] + shift)
+                for shift in (-1, 0, 1)
+            ]
+        ).merge(
+            expense_keys, on=["desc_lower", "amount_key"], suffixes=("_rev", "_exp")
+        )
+        candidates = candidates[
+            (candidates["abs_amount_rev"] - candidates["abs_amount_exp"]).abs()
+            < tolerance
+        ].sort_values(["pos_rev", "pos_exp"])
+
+        # Walk pairs in row order so each revenue takes the first unmatched
+        # expense, as the original nested scan did
+        expense_matched = np.zeros(len(expenses), dtype=bool)
+        revenue_matched = np.zeros(len(revenues), dtype=bool)
+        expense_records = _LazyRecords(expenses)
+        revenue_records = _LazyRecords(revenues)
+
+        for rev_pos, exp_pos in zip(
+            candidates["pos_rev"].tolist(), candidates["pos_exp"].tolist()
+        ):
+            if revenue_matched[rev_pos] or expense_matched[exp_pos]:
+                continue
 
-                # Check for exact match
-                if (
-                    abs(expense_amount - revenue_amount) < self.config.BALANCE_TOLERANCE
-                    and expense_desc == revenue_desc
-                ):
-                    matches.append(
-                        {
-                            "match_type": "exact",
-                            "confidence": 1.0,
-                            "revenue": revenue.to_dict(),
-                            "expenses": [expense.to_dict()],
-                            "balance": revenue_amount - expense_amount,
-                        }
-                    )
-                    matched_expense_ids.add(expense["original_index"])
-                    matched_revenue_ids.add(revenue["original_index"])
-                    break
+            revenue = revenue_records[rev_pos]
+            expense = expense_records[exp_pos]
+            matches.append(
+                {
+                    "match_type": "exact",
+                    "confidence": 1.0,
+                    "revenue": revenue,
+                    "expenses": [expense],
+                    "balance": revenue["abs_amount"] - expense["abs_amount"],
+                }
+            )
+            expense_matched[exp_pos] = True
+            revenue_matched[rev_pos] = True
 
         # Remove matched transactions
-        remaining_expenses = expenses[
-            ~expenses["original_index"].isin(matched_expense_ids)
-        ]
-        remaining_revenues = revenues[
-            ~revenues["original_index"].isin(matched_revenue_ids)
-        ]
+        remaining_expenses = expenses[~expense_matched]
+        remaining_revenues = revenues[~revenue_matched]
 
         return matches, remaining_expenses, remaining_revenues
 
     def keyword_match(
-        self, expenses: pd.DataFrame, revenues: pd.DataFrame, min_keywords: int = 2
+        self,
+        expenses: pd.DataFrame,
+        revenues: pd.DataFrame,
+        min_keywords: int = 2,
+        features: Optional[Dict] = None,
     ) -> Tuple[List[Dict], pd.DataFrame, pd.DataFrame]:
         """
         Match transactions based on shared keywords
@@ -192,60 +418,83 @@ class EntityMatcher:
             expenses: DataFrame of expense transactions
             revenues: DataFrame of revenue transactions
             min_keywords: Minimum number of shared keywords for a match
+            features: Features of both frames keyed by original_index from
+                _precompute, computed here when not given
 
         Returns:
             Tuple of (matches, remaining_expenses, remaining_revenues)
         """
         matches = []
-        matched_expense_ids = set()
-        matched_revenue_ids = set()
 
-        for _, revenue in revenues.iterrows():
-            revenue_keywords = self.extract_keywords(revenue["description"])
+        tolerance = self.config.BALANCE_TOLERANCE
+        if features is None:
+            features = {
+                **self._precompute(expenses)[0],
+                **self._precompute(revenues)[0],
+            }
+        expense_amounts = expenses["abs_amount"].to_numpy(dtype=np.float64)
+        expense_records = _LazyRecords(expenses)
+        revenue_records = _LazyRecords(revenues)
+        expense_ids = expenses["original_index"].tolist()
+        expense_positions = {idx: pos for pos, idx in enumerate(expense_ids)}
+        expense_matched = np.zeros(len(expense_ids), dtype=bool)
+        revenue_matched = np.zeros(len(revenues), dtype=bool)
+
+        # Inverted index from each keyword to the expenses that contain it
+        postings = self._keyword_postings(expense_ids, features)
+
+        for rev_pos, revenue_id in enumerate(revenues["original_index"].tolist()):
+            _, revenue_keywords, revenue_amount = features[revenue_id]
 
             if len(revenue_keywords) < min_keywords:
                 continue
 
             potential_expenses = []
 
-            for _, expense in expenses.iterrows():
-                if expense["original_index"] in matched_expense_ids:
-                    continue
+            # Count the keywords each expense shares with the revenue
+            shared_counts = np.zeros(len(expense_ids), dtype=np.int64)
+            for keyword in revenue_keywords:
+                if keyword in postings:
+                    shared_counts[postings[keyword]] += 1
+
+            # An expense larger than the revenue cannot be part of any
+            # combination that balances it, so it is never scored
+            candidates = (
+                (shared_counts >= min_keywords)
+                & ~expense_matched
+                & (expense_amounts < revenue_amount + tolerance)
+            )
 
-                expense_keywords = self.extract_keywords(expense["description"])
+            for pos in np.flatnonzero(candidates):
+                _, expense_keywords, expense_amount = features[expense_ids[pos]]
                 shared_keywords = revenue_keywords.intersection(expense_keywords)
-
-                if len(shared_keywords) >= min_keywords:
-                    keyword_score = len(shared_keywords) / max(
-                        len(revenue_keywords), len(expense_keywords)
-                    )
-                    potential_expenses.append(
-                        {
-                            "expense": expense,
-                            "shared_keywords": shared_keywords,
-                            "keyword_score": keyword_score,
-                        }
-                    )
+                keyword_score = len(shared_keywords) / max(
+                    len(revenue_keywords), len(expense_keywords)
+                )
+                potential_expenses.append(
+                    {
+                        "position": pos,
+                        "abs_amount": expense_amount,
+                        "shared_keywords": shared_keywords,
+                        "keyword_score": keyword_score,
+                    }
+                )
 
             # Try to find expense combinations that match the revenue amount
             if potential_expenses:
                 best_match = self._find_best_expense_combination(
-                    revenue, potential_expenses
+                    revenue_records[rev_pos], potential_expenses, expense_records
                 )
 
                 if best_match:
                     matches.append(best_match)
                     for exp in best_match["expenses"]:
-                        matched_expense_ids.add(exp["original_index"])
-                    matched_revenue_ids.add(revenue["original_index"])
+                        expense_matched[expense_positions[exp["original_index"]]] = True
+                    revenue_matched[rev_pos] = True
 
         # Remove matched transactions
-        remaining_expenses = expenses[
-            ~expenses["original_index"].isin(matched_expense_ids)
-        ]
-        remaining_revenues = revenues[
-            ~revenues["original_index"].isin(matched_revenue_ids)
-        ]
+        remaining_expenses = expenses[~expense_matched]
+        remaining_revenues = revenues[~revenue_matched]
 
         return matches, remaining_expenses, remaining_revenues
 
@@ -263,60 +512,103 @@ class EntityMatcher:
             Tuple of (matches, remaining_expenses, remaining_revenues)
         """
         matches = []
-        matched_expense_ids = set()
-        matched_revenue_ids = set()
 
-        for _, revenue in revenues.iterrows():
-            revenue_desc = str(revenue["description"])
-            potential_expenses = []
+        # Score revenue/expense pairs as whole percentages, rounded like
+        # calculate_similarity; pairs that cannot round up to the threshold
+        # come back as 0. Revenues are scored and matched one block of rows at
+        # a time, so only a block of scores is held in memory, and
+        # descriptions are normalized once rather than on every cdist call.
+        revenue_descs = self._fuzzy_descs(revenues)
+        expense_descs = self._fuzzy_descs(expenses)
 
-            for _, expense in expenses.iterrows():
-                if expense["original_index"] in matched_expense_ids:
-                    continue
+        # Descriptions that are only numbers or a single reference code are
+        # left to the exact and keyword levels and never scored
+        revenue_rows = np.flatnonzero(self._fuzzy_comparable(revenue_descs))
+        expense_cols = np.flatnonzero(self._fuzzy_comparable(expense_descs))
+        comparable_expense_descs = [expense_descs[pos] for pos in expense_cols]
+
+        tolerance = self.config.BALANCE_TOLERANCE
+        expense_amounts = expenses["abs_amount"].to_numpy(dtype=np.float64)
+        comparable_amounts = expense_amounts[expense_cols]
+        expense_amount_list = expenses["abs_amount"].tolist()
+        revenue_amount_list = revenues["abs_amount"].tolist()
+        expense_records = _LazyRecords(expenses)
+        revenue_records = _LazyRecords(revenues)
+        expense_positions = {
+            idx: pos for pos, idx in enumerate(expenses["original_index"].tolist())
+        }
+        expense_matched = np.zeros(len(expenses), dtype=bool)
+        revenue_matched = np.zeros(len(revenues), dtype=bool)
+
+        for start in range(0, len(revenue_rows), _CDIST_BLOCK_ROWS):
+            rows = revenue_rows[start : start + _CDIST_BLOCK_ROWS]
+            block = process.cdist(
+                [revenue_descs[pos] for pos in rows],
+                comparable_expense_descs,
+                scorer=fuzz.token_sort_ratio,
+                processor=None,
+                score_cutoff=max(self._fuzzy_threshold_i - 0.5, 0),
+                dtype=np.float32,
+                workers=self.fuzzy_workers,
+            )
+            block = np.round(block).astype(np.uint8)
 
-                expense_desc = str(expense["description"])
-                similarity = self.calculate_similarity(revenue_desc, expense_desc)
+            for rev_pos, row_scores in zip(rows.tolist(), block):
+                potential_expenses = []
 
-                if similarity >= self.fuzzy_threshold:
+                # Skip expenses too large to appear in a balancing combination
+                candidates = np.flatnonzero(
+                    (row_scores >= self._fuzzy_threshold_i)
+                    & ~expense_matched[expense_cols]
+                    & (comparable_amounts < revenue_amount_list[rev_pos] + tolerance)
+                )
+
+                for col in candidates:
+                    pos = expense_cols[col]
+                    similarity = int(row_scores[col]) / 100.0
                     potential_expenses.append(
                         {
-                            "expense": expense,
+                            "position": pos,
+                            "abs_amount": expense_amount_list[pos],
                             "similarity": similarity,
                             "keyword_score": similarity,
                         }
                     )
 
-            # Try to find expense combinations that match the revenue amount
-            if potential_expenses:
-                best_match = self._find_best_expense_combination(
-                    revenue, potential_expenses
-                )
+                # Try to find expense combinations that match the revenue amount
+                if potential_expenses:
+                    best_match = self._find_best_expense_combination(
+                        revenue_records[rev_pos], potential_expenses, expense_records
+                    )
 
-                if best_match:
-                    matches.append(best_match)
-                    for exp in best_match["expenses"]:
-                        matched_expense_ids.add(exp["original_index"])
-                    matched_revenue_ids.add(revenue["original_index"])
+                    if best_match:
+                        matches.append(best_match)
+                        for exp in best_match["expenses"]:
+                            exp_pos = expense_positions[exp["original_index"]]
+                            expense_matched[exp_pos] = True
+                        revenue_matched[rev_pos] = True
 
         # Remove matched transactions
-        remaining_expenses = expenses[
-            ~expenses["original_index"].isin(matched_expense_ids)
-        ]
-        remaining_revenues = revenues[
-            ~revenues["original_index"].isin(matched_revenue_ids)
-        ]
+        remaining_expenses = expenses[~expense_matched]
+        remaining_revenues = revenues[~revenue_matched]
 
         return matches, remaining_expenses, remaining_revenues
 
     def _find_best_expense_combination(
-        self, revenue: pd.Series, potential_expenses: List[Dict]
+        self,
+        revenue: Dict,
+        potential_expenses: List[Dict],
+        expense_records: Sequence,
     ) -> Optional[Dict]:
         """
         Find the best combination of expenses that match a revenue amount
 
         Args:
-            revenue: Revenue transaction series
-            potential_expenses: List of potential expense matches with scores
+            revenue: Revenue transaction record
+            potential_expenses: List of potential expense matches with scores,
+                each holding the expense's position in expense_records and
+                its abs_amount
+            expense_records: Records of the expense transactions
 
         Returns:
             Dictionary containing match information or None
@@ -324,107 +616,235 @@ class EntityMatcher:
         revenue_amount = revenue["abs_amount"]
         tolerance = self.config.BALANCE_TOLERANCE
 
-        # Sort by score (descending)
-        potential_expenses.sort(key=lambda x: x.get("keyword_score", 0), reverse=True)
-
-        # Try single expense match first
-        for pot_exp in potential_expenses:
-            expense = pot_exp["expense"]
-            if abs(expense["abs_amount"] - revenue_amount) < tolerance:
-                confidence = pot_exp.get("keyword_score", 0.5)
-                return {
-                    "match_type": "fuzzy_single",
-                    "confidence": confidence,
-                    "revenue": revenue.to_dict(),
-                    "expenses": [expense.to_dict()],
-                    "balance": revenue_amount - expense["abs_amount"],
-                }
-
-        # Try combinations of 2-5 expenses
-        for combo_size in range(2, min(6, len(potential_expenses) + 1)):
-            for combo in itertools.combinations(potential_expenses[:10], combo_size):
-                total_expense = sum(pe["expense"]["abs_amount"] for pe in combo)
+        # Try single expense match first, taking the best scoring one
+        singles = [
+            pe
+            for pe in potential_expenses
+            if abs(pe["abs_amount"] - revenue_amount) < tolerance
+        ]
+        if singles:
+            pot_exp = max(singles, key=lambda x: x.get("keyword_score", 0))
+            confidence = pot_exp.get("keyword_score", 0.5)
+            return {
+                "match_type": "fuzzy_single",
+                "confidence": confidence,
+                "revenue": revenue,
+                "expenses": [expense_records[pot_exp["position"]]],
+                "balance": revenue_amount - pot_exp["abs_amount"],
+            }
+
+        # Try combinations of 2-5 of the top 10 expenses: split them in two
+        # halves, and for every subset of the first half look up the subsets
+        # of the second half whose sum makes up the rest of the revenue
+        candidates = heapq.nlargest(
+            10, potential_expenses, key=lambda x: x.get("keyword_score", 0)
+        )
+        amounts = [pe["abs_amount"] for pe in candidates]
+
+        # Skip the search when no 2-5 expenses can reach the revenue amount:
+        # the two smallest already overshoot it or the five largest fall short
+        ordered = sorted(amounts)
+        if (
+            len(ordered) < 2
+            or sum(ordered[:2]) > revenue_amount + 2 * tolerance
+            or sum(ordered[-5:]) < revenue_amount - 2 * tolerance
+        ):
+            return None
+
+        half = len(candidates) // 2
+        right = sorted(self._subset_sums(amounts[half:], half))
+        right_totals = [total for total, _ in right]
+
+        best = None
+        for left_total, left_indices in self._subset_sums(amounts[:half], 0):
+            # Search a slightly wider window; each hit is re-checked below
+            rest = revenue_amount - left_total
+            lo = bisect.bisect_left(right_totals, rest - 2 * tolerance)
+            hi = bisect.bisect_right(right_totals, rest + 2 * tolerance)
+
+            for _, right_indices in right[lo:hi]:
+                indices = left_indices + right_indices
+                if not 2 <= len(indices) <= 5:
+                    continue
 
+                total_expense = sum(amounts[i] for i in indices)
                 if abs(total_expense - revenue_amount) < tolerance:
-                    # Calculate average confidence
-                    avg_confidence = sum(
-                        pe.get("keyword_score", 0) for pe in combo
-                    ) / len(combo)
-
-                    return {
-                        "match_type": f"fuzzy_multiple_{combo_size}",
-                        "confidence": avg_confidence,
-                        "revenue": revenue.to_dict(),
-                        "expenses": [pe["expense"].to_dict() for pe in combo],
-                        "balance": revenue_amount - total_expense,
-                    }
+                    # Keep the combination the size-by-size scan finds first
+                    if best is None or (len(indices), indices) < best:
+                        best = (len(indices), indices)
+
+        if best is not None:
+            combo_size, indices = best
+            combo = [candidates[i] for i in indices]
+            total_expense = sum(amounts[i] for i in indices)
+
+            # Calculate average confidence
+            avg_confidence = (
+                sum(pe.get("keyword_score", 0) for pe in combo) / combo_size
+            )
+
+            return {
+                "match_type": f"fuzzy_multiple_{combo_size}",
+                "confidence": avg_confidence,
+                "revenue": revenue,
+                "expenses": [expense_records[pe["position"]] for pe in combo],
+                "balance": revenue_amount - total_expense,
+            }
 
         return None
 
+    @staticmethod
+    def _subset_sums(
+        amounts: List[float], offset: int
+    ) -> List[Tuple[float, Tuple[int, ...]]]:
+        """
+        Enumerate every subset of a short list of amounts
+
+        Args:
+            amounts: Amounts to combine
+            offset: Index of the first amount in the full candidate list
+
+        Returns:
+            List of (total, candidate indices) pairs, indices in ascending order
+        """
+        subsets = [(0.0, ())]
+        for i, amount in enumerate(amounts, offset):
+            subsets += [(total + amount, indices + (i,)) for total, indices in subsets]
+
+        return subsets
+
     def find_potential_matches(
-        self, revenue: pd.Series, expenses: pd.DataFrame, top_n: int = 5
+        self,
+        revenue: Dict,
+        expenses: pd.DataFrame,
+        top_n: int = 5,
+        expense_index: Optional[Dict] = None,
     ) -> List[Dict]:
         """
         Find potential expense matches for a revenue transaction (for manual review)
 
         Args:
-            revenue: Revenue transaction series
+            revenue: Revenue transaction record
             expenses: DataFrame of unmatched expense transactions
             top_n: Number of top matches to return
+            expense_index: Expense lookups from _index_expenses, built here
+                when not given
 
         Returns:
             List of potential matches with scores
         """
-        revenue_desc = str(revenue["description"])
-        revenue_amount = revenue["abs_amount"]
-        revenue_keywords = self.extract_keywords(revenue_desc)
+        if expense_index is None:
+            expense_index = self._index_expenses(expenses)
 
-        potential_matches = []
+        fuzzy_scores = self._review_fuzzy_scores(
+            [str(revenue["description"])], expense_index
+        )[0]
 
-        for _, expense in expenses.iterrows():
-            expense_desc = str(expense["description"])
-            expense_keywords = self.extract_keywords(expense_desc)
+        return self._rank_potential_matches(
+            revenue, expenses, top_n, expense_index, fuzzy_scores
+        )
 
-            # Calculate various similarity scores
-            fuzzy_score = self.calculate_similarity(revenue_desc, expense_desc)
+    def _review_fuzzy_scores(
+        self, revenue_descs: List[str], expense_index: Dict
+    ) -> np.ndarray:
+        """
+        Fuzzy-score revenue descriptions against every indexed expense
 
-            # Keyword overlap score
-            if revenue_keywords and expense_keywords:
-                shared_keywords = revenue_keywords.intersection(expense_keywords)
-                keyword_score = len(shared_keywords) / max(
-                    len(revenue_keywords), len(expense_keywords)
-                )
-            else:
-                keyword_score = 0.0
+        Args:
+            revenue_descs: Revenue descriptions
+            expense_index: Expense lookups from _index_expenses
 
-            # Amount similarity (closer amounts = higher score)
-            amount_diff = abs(expense["abs_amount"] - revenue_amount)
-            amount_score = (
-                max(0, 1 - (amount_diff / revenue_amount)) if revenue_amount > 0 else 0
+        Returns:
+            float32 array of whole-percent scores, one row per revenue,
+            rounded like calculate_similarity
+        """
+        return np.round(
+            process.cdist(
+                [utils.default_process(desc) for desc in revenue_descs],
+                expense_index["descs"],
+                scorer=fuzz.token_sort_ratio,
+                processor=None,
+                dtype=np.float32,
+                workers=self.fuzzy_workers,
             )
+        )
+
+    def _rank_potential_matches(
+        self,
+        revenue: Dict,
+        expenses: pd.DataFrame,
+        top_n: int,
+        expense_index: Dict,
+        fuzzy_scores: np.ndarray,
+    ) -> List[Dict]:
+        """
+        Combine fuzzy, keyword and amount scores and keep the best expenses
 
-            # Combined score
-            combined_score = (
-                (fuzzy_score * 0.4) + (keyword_score * 0.4) + (amount_score * 0.2)
-            )
+        Args:
+            revenue: Revenue transaction record
+            expenses: DataFrame of unmatched expense transactions
+            top_n: Number of top matches to return
+            expense_index: Expense lookups from _index_expenses
+            fuzzy_scores: Whole-percent fuzzy scores of the revenue against
+                every expense
 
-            potential_matches.append(
-                {
-                    "expense": expense.to_dict(),
-                    "fuzzy_score": fuzzy_score,
-                    "keyword_score": keyword_score,
-                    "amount_score": amount_score,
-                    "combined_score": combined_score,
-                    "shared_keywords": list(
-                        revenue_keywords.intersection(expense_keywords)
-                    ),
-                }
-            )
+        Returns:
+            List of potential matches with scores
+        """
+        features = expense_index["features"]
+        ids = expense_index["ids"]
+        postings = expense_index["postings"]
 
-        # Sort by combined score
-        potential_matches.sort(key=lambda x: x["combined_score"], reverse=True)
+        revenue_amount = revenue["abs_amount"]
+        revenue_keywords = self._keywords_for(
+            revenue["original_index"], revenue["description"]
+        )
 
-        return potential_matches[:top_n]
+        # Convert to 0-1 scale
+        fuzzy_scores = fuzzy_scores.astype(np.float64) / 100.0
+
+        # Keyword overlap score, only for expenses sharing a keyword
+        shared_counts = np.zeros(len(ids), dtype=np.int64)
+        for keyword in revenue_keywords:
+            if keyword in postings:
+                shared_counts[postings[keyword]] += 1
+        keyword_scores = np.zeros(len(ids))
+        sharing = shared_counts > 0
+        keyword_scores[sharing] = shared_counts[sharing] / np.maximum(
+            len(revenue_keywords), expense_index["keyword_counts"][sharing]
+        )
+
+        # Amount similarity (closer amounts = higher score)
+        if revenue_amount > 0:
+            amount_diffs = np.abs(expense_index["abs_amounts"] - revenue_amount)
+            amount_scores = np.maximum(0, 1 - (amount_diffs / revenue_amount))
+        else:
+            amount_scores = np.zeros(len(ids))
+
+        # Combined score
+        combined_scores = (
+            (fuzzy_scores * 0.4) + (keyword_scores * 0.4) + (amount_scores * 0.2)
+        )
+
+        # Keep the top_n by combined score, ties in row order
+        top_positions = np.argsort(-combined_scores, kind="stable")[:top_n]
+
+        # Build expense records only for the matches that are returned
+        return [
+            {
+                "expense": expenses.iloc[pos].to_dict(),
+                "fuzzy_score": float(fuzzy_scores[pos]),
+                "keyword_score": float(keyword_scores[pos]),
+                "amount_score": (
+                    float(amount_scores[pos]) if amount_scores[pos] > 0 else 0
+                ),
+                "combined_score": float(combined_scores[pos]),
+                "shared_keywords": list(
+                    revenue_keywords.intersection(features[ids[pos]][1])
+                ),
+            }
+            for pos in top_positions
+        ]
 
     def auto_match_all(
         self, df: pd.DataFrame
@@ -438,6 +858,11 @@ class EntityMatcher:
         Returns:
             Tuple of (all_matches, unmatched_expenses, unmatched_revenues)
         """
+        # Start each run with fresh keywords, and extract the description
+        # features of every transaction once for all levels
+        self._keyword_cache.clear()
+        features, _ = self._precompute(df)
+
         # Split into expenses and revenues
         expenses = df[df["transaction_type"] == "expense"].copy()
         revenues = df[df["transaction_type"] == "revenue"].copy()
@@ -445,11 +870,15 @@ class EntityMatcher:
         all_matches = []
 
         # Level 1: Exact matching
-        exact_matches, expenses, revenues = self.exact_match(expenses, revenues)
+        exact_matches, expenses, revenues = self.exact_match(
+            expenses, revenues, features=features
+        )
         all_matches.extend(exact_matches)
 
         # Level 2: Keyword matching
-        keyword_matches, expenses, revenues = self.keyword_match(expenses, revenues)
+        keyword_matches, expenses, revenues = self.keyword_match(
+            expenses, revenues, features=features
+        )
         all_matches.extend(keyword_matches)
 
         # Level 3: Fuzzy matching
@@ -472,16 +901,28 @@ class EntityMatcher:
             List of review items with potential matches
         """
         review_items = []
+        expense_index = self._index_expenses(unmatched_expenses)
+        revenues = unmatched_revenues.to_dict("records")
+
+        # Revenues are scored independently, so fuzzy scores come from blocks
+        # of rows that cdist spreads across all cores
+        for start in range(0, len(revenues), _CDIST_BLOCK_ROWS):
+            block = revenues[start : start + _CDIST_BLOCK_ROWS]
+            block_scores = self._review_fuzzy_scores(
+                [str(revenue["description"]) for revenue in block], expense_index
+            )
 
-        for _, revenue in unmatched_revenues.iterrows():
-            potential_matches = self.find_potential_matches(revenue, unmatched_expenses)
+            for revenue, fuzzy_scores in zip(block, block_scores):
+                potential_matches = self._rank_potential_matches(
+                    revenue, unmatched_expenses, 5, expense_index, fuzzy_scores
+                )
 
-            review_items.append(
-                {
-                    "revenue": revenue.to_dict(),
-                    "potential_expenses": potential_matches,
-                    "status": "pending_review",
-                }
-            )
+                review_items.append(
+                    {
+                        "revenue": revenue,
+                        "potential_expenses": potential_matches,
+                        "status": "pending_review",
+                    }
+                )
 
         return review_items
@@ -0,0 +1,225 @@
+"""
+Excel Writer Module
+Streams DataFrames into write-only openpyxl worksheets
+"""
+
+import datetime
+import math
+from decimal import Decimal
+import pandas as pd
+from typing import List, Optional, Sequence, Tuple
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+from pandas.api.types import is_bool, is_float, is_integer
+
+# Number formats DataFrame.to_excel gives dates, datetimes and durations
+DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+DATE_FORMAT = "YYYY-MM-DD"
+DURATION_FORMAT = "0"
+
+
+def default_header_style() -> NamedStyle:
+    """
+    Build the header style DataFrame.to_excel writes
+
+    Header cells are bold, with thin borders, centered horizontally and
+    aligned to the top. A new style is returned on every call because named
+    styles are bound to the workbook they are added to.
+
+    Returns:
+        Named style for header cells
+    """
+    thin_side = Side(style="thin")
+    return NamedStyle(
+        "default_header",
+        font=Font(bold=True),
+        border=Border(left=thin_side, right=thin_side, top=thin_side, bottom=thin_side),
+        alignment=Alignment(horizontal="center", vertical="top"),
+    )
+
+
+def excel_value(value) -> Tuple[object, Optional[str]]:
+    """
+    Convert a present (non-missing) value the way DataFrame.to_excel does
+
+    Args:
+        value: Value taken from a DataFrame
+
+    Returns:
+        Tuple of (cell value, number format or None)
+    """
+    if is_integer(value):
+        return int(value), None
+    if is_float(value):
+        if math.isinf(value):
+            return ("inf" if value > 0 else "-inf"), None
+        return float(value), None
+    if is_bool(value):
+        return bool(value), None
+    if isinstance(value, Decimal):
+        return value, None
+    if isinstance(value, datetime.datetime):
+        return value, DATETIME_FORMAT
+    if isinstance(value, datetime.date):
+        return value, DATE_FORMAT
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds() / 86400, DURATION_FORMAT
+
+    return str(value), None
+
+
+def excel_column(series: pd.Series) -> Tuple[List, Optional[List[Optional[str]]]]:
+    """
+    Convert a column to cell values, writing missing values as empty cells
+
+    Args:
+        series: Column to convert
+
+    Returns:
+        Tuple of (cell values, per-cell number formats or None when the
+        column needs none)
+    """
+    values = []
+    formats = []
+    for value, missing in zip(series.tolist(), series.isna().tolist()):
+        value, number_format = ("", None) if missing else excel_value(value)
+        values.append(value)
+        formats.append(number_format)
+
+    return values, formats if any(formats) else None
+
+
+def highlight_matched_rows(worksheet, df: pd.DataFrame, color: str):
+    """
+    Fill rows whose match_status is 'matched' through one conditional format
+
+    Excel applies the rule when the file is opened, so no cell has to be
+    styled while the rows are written, and the fill follows later edits of
+    the status column.
+
+    Args:
+        worksheet: Worksheet df was written to by write_excel_sheet
+        df: DataFrame written to the worksheet
+        color: Fill color as an RGB hex string
+    """
+    if "match_status" not in df.columns or df.empty:
+        return
+
+    status_column = get_column_letter(df.columns.tolist().index("match_status") + 1)
+    fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
+    worksheet.conditional_formatting.add(
+        f"A2:{get_column_letter(df.shape[1])}{len(df) + 1}",
+        FormulaRule(formula=[f'${status_column}2="matched"'], fill=fill),
+    )
+
+
+def write_excel_sheet(
+    workbook,
+    title: str,
+    df: pd.DataFrame,
+    header_style: Optional[NamedStyle] = None,
+    row_styles: Optional[Sequence[Optional[NamedStyle]]] = None,
+    max_width: Optional[int] = None,
+):
+    """
+    Append a DataFrame (header row plus one row per record) to a new sheet
+
+    Cells get the same values and number formats as DataFrame.to_excel with
+    index=False. Styles are named styles, registered with the workbook once,
+    so each cell takes all of its style attributes in a single assignment.
+
+    Args:
+        workbook: Write-only openpyxl Workbook
+        title: Sheet name
+        df: DataFrame to write
+        header_style: Style of the header cells; default_header_style() when
+            not given, as DataFrame.to_excel would write them
+        row_styles: Style of each data row (None for an unstyled row)
+        max_width: Fit column widths to their longest value, capped at this
+            many characters; widths are left alone when not given
+
+    Returns:
+        The new worksheet
+    """
+    worksheet = workbook.create_sheet(title)
+    if header_style is None:
+        header_style = default_header_style()
+
+    styles = {id(style): style for style in [header_style, *(row_styles or [])]}
+    for style in styles.values():
+        if style is not None and style.name not in workbook.named_styles:
+            workbook.add_named_style(style)
+
+    header, _ = excel_column(pd.Series(df.columns, dtype=object))
+    columns = [excel_column(df.iloc[:, i]) for i in range(df.shape[1])]
+
+    # Column widths must be set before the first row is streamed out
+    if max_width is not None:
+        for col_idx, (name, (values, _)) in enumerate(zip(header, columns), 1):
+            longest = max(map(len, map(str, values)), default=0)
+            longest = max(longest, len(str(name)))
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = min(
+                longest + 2, max_width
+            )
+
+    worksheet.append(_sheet_row(worksheet, header, None, header_style))
+
+    values_by_row = zip(*(values for values, _ in columns))
+    formats = [column_formats for _, column_formats in columns]
+    if not any(formats):
+        formats = None
+
+    for row_idx, values in enumerate(values_by_row):
+        style = row_styles[row_idx] if row_styles is not None else None
+        row_formats = None
+        if formats is not None:
+            row_formats = [
+                column_formats[row_idx] if column_formats else None
+                for column_formats in formats
+            ]
+        worksheet.append(_sheet_row(worksheet, values, row_formats, style))
+
+    return worksheet
+
+
+def _sheet_row(
+    worksheet,
+    values: Sequence,
+    formats: Optional[List[Optional[str]]],
+    style: Optional[NamedStyle],
+) -> List:
+    """
+    Build one row for WriteOnlyWorksheet.append
+
+    Plain values are appended as they are; only cells with a style or a
+    number format become WriteOnlyCell objects.
+
+    Args:
+        worksheet: Write-only worksheet the row belongs to
+        values: Cell values
+        formats: Number format of each cell, if any
+        style: Named style of every cell in the row, if any
+
+    Returns:
+        List of values and cells
+    """
+    if style is None and formats is None:
+        return list(values)
+
+    row = []
+    for col_idx, value in enumerate(values):
+        number_format = formats[col_idx] if formats else None
+        if style is None and number_format is None:
+            row.append(value)
+            continue
+
+        cell = WriteOnlyCell(worksheet, value=value)
+        if style is not None:
+            cell.style = style.name
+        if number_format is not None:
+            cell.number_format = number_format
+        row.append(cell)
+
+    return row
@@ -4,12 +4,32 @@ Handles file export operations for reconciliation results
 """
 
 import os
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+from openpyxl import Workbook
+from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+
+from .csv_writer import write_csv
+from .excel_writer import highlight_matched_rows, write_excel_sheet
+
+
+class _MatchIndex:
+    """Row masks by match status and transaction type, computed once per export"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: DataFrame with reconciliation data
+        """
+        match_status = df["match_status"].to_numpy()
+        transaction_type = df["transaction_type"].to_numpy()
+        self.matched = match_status == "matched"
+        self.unmatched = match_status == "unmatched"
+        self.expense = transaction_type == "expense"
+        self.revenue = transaction_type == "revenue"
 
 
 class Exporter:
@@ -24,6 +44,33 @@ class Exporter:
         """
         self.config = config
         self.upload_folder = config.UPLOAD_FOLDER
+        self.polars_csv = getattr(config, "POLARS_CSV", False)
+        self.csv_chunk_rows = getattr(config, "CSV_CHUNK_ROWS", None)
+
+        # Style parts of the grouped Excel export; openpyxl style objects are
+        # immutable, so one set is shared by every export
+        thin_side = Side(style="thin")
+        self._styles = {
+            "header_fill": PatternFill(
+                start_color="366092", end_color="366092", fill_type="solid"
+            ),
+            "header_font": Font(bold=True, color="FFFFFF"),
+            "header_alignment": Alignment(horizontal="center", vertical="center"),
+            "plain_fill": PatternFill(),
+            "matched_fill": PatternFill(
+                start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
+            ),
+            "unmatched_fill": PatternFill(
+                start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
+            ),
+            "separator_fill": PatternFill(
+                start_color="D9D9D9", end_color="D9D9D9", fill_type="solid"
+            ),
+            "row_alignment": Alignment(vertical="center"),
+            "thin_border": Border(
+                left=thin_side, right=thin_side, top=thin_side, bottom=thin_side
+            ),
+        }
 
     def create_new_reconciled_file(
         self,
@@ -46,12 +93,16 @@ class Exporter:
         """
         try:
             # Create reconciliation DataFrame
-            reconciled_data = self._prepare_grouped_data(df, matches)
+            reconciled_data = self._prepare_grouped_data(df, matches, _MatchIndex(df))
 
             if file_format.lower() == "csv":
                 return self._export_grouped_csv(reconciled_data, output_path)
             elif file_format.lower() in ["xlsx", "xls"]:
                 return self._export_grouped_excel(reconciled_data, matches, output_path)
+            elif file_format.lower() in ["parquet", "feather"]:
+                return self._export_grouped_columnar(
+                    reconciled_data, output_path, file_format.lower()
+                )
             else:
                 return False, f"Unsupported format: {file_format}"
 
@@ -90,15 +141,34 @@ class Exporter:
             updated_df = self._add_status_columns(df, matches, options)
 
             if ext.lower() == ".csv":
-                updated_df.to_csv(output_path, index=False)
+                write_csv(
+                    updated_df,
+                    output_path,
+                    fast=self.polars_csv,
+                    chunksize=self.csv_chunk_rows,
+                )
                 return True, f"File updated successfully", output_path
 
-            elif ext.lower() in [".xlsx", ".xls"]:
-                # Export to Excel with optional highlighting
-                updated_df.to_excel(output_path, index=False, engine="openpyxl")
+            elif ext.lower() == ".parquet":
+                updated_df.to_parquet(output_path, engine="pyarrow", compression="zstd")
+                return True, f"File updated successfully", output_path
+
+            elif ext.lower() == ".feather":
+                updated_df.reset_index(drop=True).to_feather(
+                    output_path, compression="zstd"
+                )
+                return True, f"File updated successfully", output_path
 
+            elif ext.lower() in [".xlsx", ".xls"]:
+                # Export to Excel in one pass, marking matched rows with a
+                # conditional format when highlighting is on
+                workbook = Workbook(write_only=True)
+                worksheet = write_excel_sheet(workbook, "Sheet1", updated_df)
                 if options.get("highlight", False):
-                    self._apply_highlighting(output_path, updated_df, matches)
+                    highlight_matched_rows(
+                        worksheet, updated_df, self.config.DEFAULT_HIGHLIGHT_COLOR
+                    )
+                workbook.save(output_path)
 
                 return True, f"File updated successfully", output_path
 
@@ -109,7 +179,10 @@ class Exporter:
             return False, f"Error updating file: {str(e)}", ""
 
     def _prepare_grouped_data(
-        self, df: pd.DataFrame, matches: List[Dict]
+        self,
+        df: pd.DataFrame,
+        matches: List[Dict],
+        index: Optional[_MatchIndex] = None,
     ) -> pd.DataFrame:
         """
         Prepare data grouped by match groups
@@ -117,57 +190,87 @@ class Exporter:
         Args:
             df: Original DataFrame
             matches: List of matched groups
+            index: Row masks of df, computed here when not given
 
         Returns:
             DataFrame with grouped reconciliation data
         """
-        grouped_rows = []
+        # Collect the revenue and expense records of every match group, and
+        # which group each one belongs to
+        records = []
+        group_numbers = []
+        group_positions = []
+        group_sizes = []
 
         for idx, match in enumerate(matches):
-            match_group_id = f"MG_{idx:04d}"
             revenue = match.get("revenue", {})
             expenses = match.get("expenses", [])
-            confidence = match.get("confidence", 0.0)
-            match_type = match.get("match_type", "unknown")
 
-            # Add revenue row
             if revenue:
-                revenue_row = revenue.copy()
-                revenue_row["match_group_id"] = match_group_id
-                revenue_row["match_status"] = "matched"
-                revenue_row["match_confidence"] = f"{confidence * 100:.1f}%"
-                revenue_row["match_type"] = match_type
-                revenue_row["group_position"] = "revenue"
-                grouped_rows.append(revenue_row)
-
-            # Add expense rows
+                records.append(revenue)
+                group_numbers.append(idx)
+                group_positions.append("revenue")
+
             for exp_num, expense in enumerate(expenses, 1):
-                expense_row = expense.copy()
-                expense_row["match_group_id"] = match_group_id
-                expense_row["match_status"] = "matched"
-                expense_row["match_confidence"] = f"{confidence * 100:.1f}%"
-                expense_row["match_type"] = match_type
-                expense_row["group_position"] = f"expense_{exp_num}"
-                grouped_rows.append(expense_row)
-
-            # Add separator row for better readability
-            if idx < len(matches) - 1:
-                separator = {col: "" for col in grouped_rows[0].keys()}
-                separator["match_group_id"] = "---"
-                grouped_rows.append(separator)
+                records.append(expense)
+                group_numbers.append(idx)
+                group_positions.append(f"expense_{exp_num}")
+
+            group_sizes.append(len(expenses) + (1 if revenue else 0))
+
+        # Add the match columns to all matched rows at once
+        group_numbers = np.array(group_numbers, dtype=np.int64)
+        group_ids = np.array(
+            [f"MG_{idx:04d}" for idx in range(len(matches))], dtype=object
+        )
+        confidences = np.char.mod(
+            "%.1f%%", self._confidence_array(matches) * 100
+        ).astype(object)
+        match_types = np.array(
+            [match.get("match_type", "unknown") for match in matches], dtype=object
+        )
+
+        matched_rows = pd.DataFrame(records)
+        if records:
+            matched_rows["match_group_id"] = group_ids[group_numbers]
+            matched_rows["match_status"] = "matched"
+            matched_rows["match_confidence"] = confidences[group_numbers]
+            matched_rows["match_type"] = match_types[group_numbers]
+            matched_rows["group_position"] = group_positions
+
+        # Add separator rows between groups for better readability
+        separator_count = max(len(matches) - 1, 0)
+        separators = pd.DataFrame(
+            "", index=range(separator_count), columns=matched_rows.columns
+        )
+        separators["match_group_id"] = "---"
+
+        # Each separator follows the last row of its group
+        order = np.insert(
+            np.arange(len(records)),
+            np.cumsum(group_sizes[:separator_count], dtype=np.int64),
+            np.arange(len(records), len(records) + separator_count),
+        )
+        if separator_count:
+            matched_rows = pd.concat([matched_rows, separators], ignore_index=True)
+        grouped = matched_rows.take(order)
 
         # Add unmatched transactions
-        unmatched = df[df["match_status"] == "unmatched"]
-        for _, row in unmatched.iterrows():
-            unmatched_row = row.to_dict()
-            unmatched_row["match_group_id"] = "UNMATCHED"
-            unmatched_row["match_status"] = "unmatched"
-            unmatched_row["match_confidence"] = "N/A"
-            unmatched_row["match_type"] = "N/A"
-            unmatched_row["group_position"] = "unmatched"
-            grouped_rows.append(unmatched_row)
-
-        return pd.DataFrame(grouped_rows)
+        if index is None:
+            index = _MatchIndex(df)
+        unmatched_rows = df[index.unmatched].assign(
+            match_group_id="UNMATCHED",
+            match_status="unmatched",
+            match_confidence="N/A",
+            match_type="N/A",
+            group_position="unmatched",
+        )
+
+        blocks = [block for block in (grouped, unmatched_rows) if not block.empty]
+        if not blocks:
+            return pd.DataFrame()
+
+        return pd.concat(blocks, ignore_index=True)
 
     def _export_grouped_csv(
         self, df: pd.DataFrame, output_path: str
@@ -183,11 +286,50 @@ class Exporter:
             Tuple of (success, message)
         """
         try:
-            df.to_csv(output_path, index=False)
+            write_csv(
+                df, output_path, fast=self.polars_csv, chunksize=self.csv_chunk_rows
+            )
             return True, f"CSV file created successfully: {output_path}"
         except Exception as e:
             return False, f"Error exporting to CSV: {str(e)}"
 
+    def _export_grouped_columnar(
+        self, df: pd.DataFrame, output_path: str, file_format: str
+    ) -> Tuple[bool, str]:
+        """
+        Export grouped data to a zstd-compressed Parquet or Feather file
+
+        Separator rows only help readability in spreadsheets, so they are
+        left out, and columns that still mix types are stored as strings.
+
+        Args:
+            df: DataFrame to export
+            output_path: Output file path
+            file_format: 'parquet' or 'feather'
+
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            if "match_group_id" in df.columns:
+                df = df[df["match_group_id"] != "---"]
+            df = df.reset_index(drop=True).infer_objects()
+
+            mixed = df.select_dtypes(include="object").columns
+            df = df.astype({col: "string" for col in mixed})
+
+            if file_format == "parquet":
+                df.to_parquet(output_path, engine="pyarrow", compression="zstd")
+            else:
+                df.to_feather(output_path, compression="zstd")
+
+            return (
+                True,
+                f"{file_format.title()} file created successfully: {output_path}",
+            )
+        except Exception as e:
+            return False, f"Error exporting to {file_format.title()}: {str(e)}"
+
     def _export_grouped_excel(
         self, df: pd.DataFrame, matches: List[Dict], output_path: str
     ) -> Tuple[bool, str]:
@@ -203,91 +345,81 @@ class Exporter:
             Tuple of (success, message)
         """
         try:
-            # Write to Excel
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                df.to_excel(writer, sheet_name="Reconciliation", index=False)
-
-                # Get workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets["Reconciliation"]
-
-                # Apply formatting
-                self._format_grouped_excel(worksheet, df, matches)
+            # Stream the styled rows straight into a write-only workbook
+            header_style, row_styles = self._format_grouped_excel(df, matches)
+
+            workbook = Workbook(write_only=True)
+            write_excel_sheet(
+                workbook,
+                "Reconciliation",
+                df,
+                header_style=header_style,
+                row_styles=row_styles,
+                max_width=50,
+            )
+            workbook.save(output_path)
 
             return True, f"Excel file created successfully: {output_path}"
 
         except Exception as e:
             return False, f"Error exporting to Excel: {str(e)}"
 
-    def _format_grouped_excel(self, worksheet, df: pd.DataFrame, matches: List[Dict]):
+    def _format_grouped_excel(
+        self, df: pd.DataFrame, matches: List[Dict]
+    ) -> Tuple[NamedStyle, List[NamedStyle]]:
         """
-        Apply formatting to grouped Excel worksheet
+        Build the named cell styles of the grouped Excel worksheet
 
         Args:
-            worksheet: openpyxl worksheet object
             df: DataFrame being exported
             matches: List of matched groups
+
+        Returns:
+            Tuple of (header style, style of each data row)
         """
-        # Define styles
-        header_fill = PatternFill(
-            start_color="366092", end_color="366092", fill_type="solid"
+        styles = self._styles
+
+        # Named styles are bound to the workbook they are added to, so they
+        # are made per export from the shared style parts
+        header_style = NamedStyle(
+            "header",
+            fill=styles["header_fill"],
+            font=styles["header_font"],
+            alignment=styles["header_alignment"],
+            border=styles["thin_border"],
         )
-        header_font = Font(bold=True, color="FFFFFF")
 
-        matched_fill = PatternFill(
-            start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
-        )
-        unmatched_fill = PatternFill(
-            start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
+        # Every data cell gets the border, plus a fill based on its row status
+        row_styles_by_group = [
+            NamedStyle(
+                name,
+                fill=styles[f"{name}_fill"],
+                font=DEFAULT_FONT,
+                alignment=styles["row_alignment"],
+                border=styles["thin_border"],
+            )
+            for name in ("plain", "matched", "unmatched", "separator")
+        ]
+
+        # Pick each row's style from masks over the status columns
+        statuses = (
+            df["match_status"].to_numpy(dtype=object)
+            if "match_status" in df
+            else np.full(len(df), "", dtype=object)
         )
-        separator_fill = PatternFill(
-            start_color="D9D9D9", end_color="D9D9D9", fill_type="solid"
+        group_ids = (
+            df["match_group_id"].to_numpy(dtype=object)
+            if "match_group_id" in df
+            else np.full(len(df), "", dtype=object)
         )
-
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
+        groups = np.select(
+            [statuses == "matched", statuses == "unmatched", group_ids == "---"],
+            [1, 2, 3],
+            default=0,
         )
+        row_styles = [row_styles_by_group[group] for group in groups.tolist()]
 
-        # Format header row
-        for cell in worksheet[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = thin_border
-
-        # Format data rows
-        for idx, row in enumerate(worksheet.iter_rows(min_row=2), start=2):
-            match_status = df.iloc[idx - 2].get("match_status", "")
-
-            for cell in row:
-                cell.border = thin_border
-                cell.alignment = Alignment(vertical="center")
-
-                # Apply background color based on status
-                if match_status == "matched":
-                    cell.fill = matched_fill
-                elif match_status == "unmatched":
-                    cell.fill = unmatched_fill
-                elif df.iloc[idx - 2].get("match_group_id", "") == "---":
-                    cell.fill = separator_fill
-
-        # Auto-adjust column widths
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+        return header_style, row_styles
 
     def _add_status_columns(
         self, df: pd.DataFrame, matches: List[Dict], options: Dict
@@ -308,58 +440,18 @@ class Exporter:
         status_columns = options.get("status_columns", [])
         status_text = options.get("status_text", self.config.DEFAULT_STATUS_TEXT)
 
-        # Add new columns if they don't exist
+        matched = (df_copy["match_status"] == "matched").to_numpy()
+
         for col in status_columns:
             if col not in df_copy.columns:
-                df_copy[col] = ""
-
-        # Update matched rows
-        matched_indices = df_copy[df_copy["match_status"] == "matched"].index
-
-        for idx in matched_indices:
-            for col in status_columns:
-                df_copy.at[idx, col] = status_text
+                # New columns are filled in one pass
+                df_copy[col] = np.where(matched, status_text, "")
+            elif matched.any():
+                # Existing columns keep their values on unmatched rows
+                df_copy.loc[matched, col] = status_text
 
         return df_copy
 
-    def _apply_highlighting(
-        self, file_path: str, df: pd.DataFrame, matches: List[Dict]
-    ):
-        """
-        Apply highlighting to matched rows in Excel file
-
-        Args:
-            file_path: Path to Excel file
-            df: DataFrame with data
-            matches: List of matched groups
-        """
-        try:
-            # Load workbook
-            workbook = load_workbook(file_path)
-            worksheet = workbook.active
-
-            # Define highlight color
-            yellow_fill = PatternFill(
-                start_color=self.config.DEFAULT_HIGHLIGHT_COLOR,
-                end_color=self.config.DEFAULT_HIGHLIGHT_COLOR,
-                fill_type="solid",
-            )
-
-            # Highlight matched rows
-            matched_indices = df[df["match_status"] == "matched"].index
-
-            for idx in matched_indices:
-                excel_row = idx + 2  # +2 for Excel 1-indexing and header row
-
-                for cell in worksheet[excel_row]:
-                    cell.fill = yellow_fill
-
-            # Save workbook
-            workbook.save(file_path)
-
-        except Exception as e:
-            print(f"Warning: Could not apply highlighting: {str(e)}")
-
     def generate_reconciliation_report(
         self, df: pd.DataFrame, matches: List[Dict], output_path: str
     ) -> Tuple[bool, str]:
@@ -375,68 +467,77 @@ class Exporter:
             Tuple of (success, message)
         """
         try:
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                # Summary sheet
-                summary_data = self._create_summary_data(df, matches)
-                summary_df = pd.DataFrame([summary_data])
-                summary_df.to_excel(writer, sheet_name="Summary", index=False)
-
-                # Matched transactions sheet
-                matched_df = df[df["match_status"] == "matched"]
-                if not matched_df.empty:
-                    matched_df.to_excel(writer, sheet_name="Matched", index=False)
-
-                # Unmatched transactions sheet
-                unmatched_df = df[df["match_status"] == "unmatched"]
-                if not unmatched_df.empty:
-                    unmatched_df.to_excel(writer, sheet_name="Unmatched", index=False)
-
-                # Match details sheet
-                match_details = self._create_match_details(matches)
-                match_details_df = pd.DataFrame(match_details)
-                if not match_details_df.empty:
-                    match_details_df.to_excel(
-                        writer, sheet_name="Match Details", index=False
-                    )
+            workbook = Workbook(write_only=True)
+
+            # Summary sheet
+            index = _MatchIndex(df)
+            summary_data = self._create_summary_data(df, matches, index)
+            summary_df = pd.DataFrame([summary_data])
+            write_excel_sheet(workbook, "Summary", summary_df)
+
+            # Matched transactions sheet
+            matched_df = df[index.matched]
+            if not matched_df.empty:
+                write_excel_sheet(workbook, "Matched", matched_df)
+
+            # Unmatched transactions sheet
+            unmatched_df = df[index.unmatched]
+            if not unmatched_df.empty:
+                write_excel_sheet(workbook, "Unmatched", unmatched_df)
+
+            # Match details sheet
+            match_details_df = self._create_match_details(matches)
+            if not match_details_df.empty:
+                write_excel_sheet(workbook, "Match Details", match_details_df)
+
+            workbook.save(output_path)
 
             return True, f"Reconciliation report created: {output_path}"
 
         except Exception as e:
             return False, f"Error generating report: {str(e)}"
 
-    def _create_summary_data(self, df: pd.DataFrame, matches: List[Dict]) -> Dict:
+    def _create_summary_data(
+        self,
+        df: pd.DataFrame,
+        matches: List[Dict],
+        index: Optional[_MatchIndex] = None,
+    ) -> Dict:
         """
         Create summary statistics for report
 
         Args:
             df: DataFrame with reconciliation data
             matches: List of matched groups
+            index: Row masks of df, computed here when not given
 
         Returns:
             Dictionary with summary data
         """
-        expenses = df[df["transaction_type"] == "expense"]
-        revenues = df[df["transaction_type"] == "revenue"]
-        matched = df[df["match_status"] == "matched"]
-        unmatched = df[df["match_status"] == "unmatched"]
+        if index is None:
+            index = _MatchIndex(df)
+
+        # Count and total through masks over the raw arrays, not filtered copies
+        amounts = df["amount"].to_numpy(dtype=np.float64)
+        matched_count = int(index.matched.sum())
 
         return {
             "Report Date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "Total Transactions": len(df),
-            "Total Expenses": len(expenses),
-            "Total Revenues": len(revenues),
-            "Matched Transactions": len(matched),
-            "Unmatched Transactions": len(unmatched),
+            "Total Expenses": int(index.expense.sum()),
+            "Total Revenues": int(index.revenue.sum()),
+            "Matched Transactions": matched_count,
+            "Unmatched Transactions": int(index.unmatched.sum()),
             "Match Rate (%)": round(
-                (len(matched) / len(df) * 100) if len(df) > 0 else 0, 2
+                (matched_count / len(df) * 100) if len(df) > 0 else 0, 2
             ),
             "Total Match Groups": len(matches),
-            "Total Expense Amount": abs(expenses["amount"].sum()),
-            "Total Revenue Amount": revenues["amount"].sum(),
-            "Net Balance": df["amount"].sum(),
+            "Total Expense Amount": abs(amounts[index.expense].sum()),
+            "Total Revenue Amount": amounts[index.revenue].sum(),
+            "Net Balance": amounts.sum(),
         }
 
-    def _create_match_details(self, matches: List[Dict]) -> List[Dict]:
+    def _create_match_details(self, matches: List[Dict]) -> pd.DataFrame:
         """
         Create detailed match information
 
@@ -444,35 +545,56 @@ class Exporter:
             matches: List of matched groups
 
         Returns:
-            List of match detail dictionaries
+            DataFrame with one row of match details per match group
         """
-        details = []
+        # Gather one list per column, then derive balances in one pass
+        match_types = []
+        revenue_amounts = []
+        expense_counts = []
+        expense_totals = []
 
-        for idx, match in enumerate(matches):
-            match_group_id = f"MG_{idx:04d}"
+        for match in matches:
             revenue = match.get("revenue", {})
             expenses = match.get("expenses", [])
-            confidence = match.get("confidence", 0.0)
-            match_type = match.get("match_type", "unknown")
-
-            revenue_amount = abs(revenue.get("amount", 0)) if revenue else 0
-            expense_total = sum(abs(exp.get("amount", 0)) for exp in expenses)
-            balance = revenue_amount - expense_total
-
-            details.append(
-                {
-                    "Match Group ID": match_group_id,
-                    "Match Type": match_type,
-                    "Confidence (%)": round(confidence * 100, 1),
-                    "Revenue Amount": revenue_amount,
-                    "Expense Count": len(expenses),
-                    "Total Expenses": expense_total,
-                    "Balance": balance,
-                    "Status": "Balanced" if abs(balance) < 0.01 else "Unbalanced",
-                }
-            )
 
-        return details
+            match_types.append(match.get("match_type", "unknown"))
+            revenue_amounts.append(abs(revenue.get("amount", 0)) if revenue else 0)
+            expense_counts.append(len(expenses))
+            expense_totals.append(sum(abs(exp.get("amount", 0)) for exp in expenses))
+
+        revenue_amounts = np.array(revenue_amounts)
+        expense_totals = np.array(expense_totals)
+        balances = revenue_amounts - expense_totals
+
+        return pd.DataFrame(
+            {
+                "Match Group ID": [f"MG_{idx:04d}" for idx in range(len(matches))],
+                "Match Type": match_types,
+                "Confidence (%)": np.round(self._confidence_array(matches) * 100, 1),
+                "Revenue Amount": revenue_amounts,
+                "Expense Count": np.array(expense_counts, dtype=np.int64),
+                "Total Expenses": expense_totals,
+                "Balance": balances,
+                "Status": np.where(np.abs(balances) < 0.01, "Balanced", "Unbalanced"),
+            }
+        )
+
+    @staticmethod
+    def _confidence_array(matches: List[Dict]) -> np.ndarray:
+        """
+        Collect the confidence of every match into one float array
+
+        Args:
+            matches: List of matched groups
+
+        Returns:
+            Array of confidences between 0 and 1
+        """
+        return np.fromiter(
+            (match.get("confidence", 0.0) for match in matches),
+            dtype=np.float64,
+            count=len(matches),
+        )
 
     def export_unmatched_only(
         self, df: pd.DataFrame, output_path: str
@@ -488,22 +610,20 @@ class Exporter:
             Tuple of (success, message)
         """
         try:
-            unmatched = df[df["match_status"] == "unmatched"]
+            index = _MatchIndex(df)
 
-            if unmatched.empty:
+            if not index.unmatched.any():
                 return False, "No unmatched transactions to export"
 
             # Separate expenses and revenues
-            unmatched_expenses = unmatched[unmatched["transaction_type"] == "expense"]
-            unmatched_revenues = unmatched[unmatched["transaction_type"] == "revenue"]
-
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                unmatched_expenses.to_excel(
-                    writer, sheet_name="Unmatched Expenses", index=False
-                )
-                unmatched_revenues.to_excel(
-                    writer, sheet_name="Unmatched Revenues", index=False
-                )
+            unmatched_expenses = df[index.unmatched & index.expense]
+            unmatched_revenues = df[index.unmatched & index.revenue]
+
+            # Stream both sheets through a write-only workbook
+            workbook = Workbook(write_only=True)
+            write_excel_sheet(workbook, "Unmatched Expenses", unmatched_expenses)
+            write_excel_sheet(workbook, "Unmatched Revenues", unmatched_revenues)
+            workbook.save(output_path)
 
             return True, f"Unmatched transactions exported: {output_path}"
 
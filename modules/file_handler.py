@@ -4,10 +4,27 @@ Handles file upload, parsing, and data extraction operations
 """
 
 import os
+import shutil
+import tempfile
+import importlib.util
 import pandas as pd
 from werkzeug.utils import secure_filename
 from typing import Dict, List, Tuple, Optional
 import numpy as np
+from openpyxl import Workbook
+
+from .csv_writer import write_csv
+from .excel_writer import highlight_matched_rows, write_excel_sheet
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    PYARROW_AVAILABLE = True
+except ImportError:  # pyarrow is optional for reading
+    PYARROW_AVAILABLE = False
+
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
 
 
 class FileHandler:
@@ -23,6 +40,13 @@ class FileHandler:
         self.config = config
         self.upload_folder = config.UPLOAD_FOLDER
         self.allowed_extensions = config.ALLOWED_EXTENSIONS
+        self.allowed_suffixes = tuple(
+            "." + ext.lower() for ext in sorted(self.allowed_extensions)
+        )
+        self.upload_buffer_size = config.UPLOAD_BUFFER_SIZE
+        self.fast_io = getattr(config, "FAST_IO", False)
+        self.polars_csv = getattr(config, "POLARS_CSV", False)
+        self.csv_chunk_rows = getattr(config, "CSV_CHUNK_ROWS", None)
 
     def allowed_file(self, filename: str) -> bool:
         """
@@ -34,10 +58,7 @@ class FileHandler:
         Returns:
             bool: True if file extension is allowed, False otherwise
         """
-        return (
-            "." in filename
-            and filename.rsplit(".", 1)[1].lower() in self.allowed_extensions
-        )
+        return filename.lower().endswith(self.allowed_suffixes)
 
     def save_uploaded_file(self, file) -> Tuple[bool, str, str]:
         """
@@ -62,23 +83,39 @@ class FileHandler:
         # Secure the filename
         filename = secure_filename(file.filename)
 
-        # Create unique filename to avoid conflicts
-        base_name, ext = os.path.splitext(filename)
-        counter = 1
-        final_filename = filename
-
-        while os.path.exists(os.path.join(self.upload_folder, final_filename)):
-            final_filename = f"{base_name}_{counter}{ext}"
-            counter += 1
-
-        file_path = os.path.join(self.upload_folder, final_filename)
-
         try:
-            file.save(file_path)
+            fd, file_path = self._reserve_upload_path(filename)
+
+            # Stream to disk in large chunks instead of FileStorage.save's 16 KB
+            with os.fdopen(fd, "wb", buffering=self.upload_buffer_size) as out:
+                shutil.copyfileobj(file.stream, out, length=self.upload_buffer_size)
             return True, "File uploaded successfully", file_path
         except Exception as e:
             return False, f"Error saving file: {str(e)}", ""
 
+    def _reserve_upload_path(self, filename: str) -> Tuple[int, str]:
+        """
+        Atomically create a new file for an upload in the upload folder
+
+        The upload keeps its own name when that is free; otherwise a random
+        suffix is added, so concurrent uploads never share a path.
+
+        Args:
+            filename: Secured name of the uploaded file
+
+        Returns:
+            Tuple of (open file descriptor, file path)
+        """
+        file_path = os.path.join(self.upload_folder, filename)
+        try:
+            flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+            return os.open(file_path, flags, 0o644), file_path
+        except FileExistsError:
+            base_name, ext = os.path.splitext(filename)
+            return tempfile.mkstemp(
+                prefix=f"{base_name}_", suffix=ext, dir=self.upload_folder
+            )
+
     def read_file(self, file_path: str) -> Tuple[bool, str, Optional[pd.DataFrame]]:
         """
         Read CSV or Excel file into pandas DataFrame
@@ -96,9 +133,18 @@ class FileHandler:
             file_extension = os.path.splitext(file_path)[1].lower()
 
             if file_extension == ".csv":
-                df = pd.read_csv(file_path)
+                df = self._read_csv(file_path)
             elif file_extension in [".xlsx", ".xls"]:
-                df = pd.read_excel(file_path, engine="openpyxl")
+                if self.fast_io and CALAMINE_AVAILABLE:
+                    df = pd.read_excel(file_path, engine="calamine")
+                else:
+                    # pandas already opens the workbook with openpyxl's
+                    # streaming reader (read_only=True, data_only=True)
+                    df = pd.read_excel(file_path, engine="openpyxl")
+            elif file_extension == ".parquet":
+                df = pd.read_parquet(file_path, engine="pyarrow")
+            elif file_extension == ".feather":
+                df = pd.read_feather(file_path)
             else:
                 return False, "Unsupported file format", None
 
@@ -110,6 +156,50 @@ class FileHandler:
         except Exception as e:
             return False, f"Error reading file: {str(e)}", None
 
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """
+        Read a CSV file, using PyArrow's multithreaded reader when enabled
+
+        Falls back to pandas whenever the Arrow result would differ from what
+        pandas produces (blank or duplicate headers, types that change after
+        the first block).
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            DataFrame with the file contents
+        """
+        if not (self.fast_io and PYARROW_AVAILABLE):
+            return pd.read_csv(file_path)
+
+        read_options = pa_csv.ReadOptions(block_size=8 * 1024 * 1024)
+
+        try:
+            # Peek at the schema inferred from the first block so date-like
+            # columns can be kept as text, as pandas does
+            with pa_csv.open_csv(file_path, read_options=read_options) as reader:
+                schema = reader.schema
+
+            names = schema.names
+            if "" in names or len(set(names)) != len(names):
+                return pd.read_csv(file_path)
+
+            column_types = {
+                field.name: pa.string()
+                for field in schema
+                if pa.types.is_temporal(field.type)
+            }
+            table = pa_csv.read_csv(
+                file_path,
+                read_options=read_options,
+                convert_options=pa_csv.ConvertOptions(column_types=column_types),
+            )
+            return table.to_pandas()
+
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return pd.read_csv(file_path)
+
     def analyze_columns(self, df: pd.DataFrame) -> Dict:
         """
         Analyze DataFrame columns to identify potential amount and description columns
@@ -141,9 +231,11 @@ class FileHandler:
                 # Check for text columns
                 analysis["text_columns"].append(col)
 
-                # Suggest as description column (longest text on average)
+                # Suggest as description column (longest text on average),
+                # estimated from the first rows only
                 if not analysis["suggested_description_column"]:
-                    avg_length = df[col].astype(str).str.len().mean()
+                    sample = df[col].head(self.config.COLUMN_SAMPLE_ROWS)
+                    avg_length = sample.astype(str).str.len().mean()
                     if (
                         avg_length > 10
                     ):  # Arbitrary threshold for meaningful descriptions
@@ -185,33 +277,30 @@ class FileHandler:
                     None,
                 )
 
-            # Create a copy to avoid modifying original
-            processed_df = df.copy()
+            # Keep only rows with a valid, non-zero amount, copying just those
+            # so the new columns never write into the caller's frame
+            amounts = pd.to_numeric(df[amount_column], errors="coerce")
+            keep = (amounts.notna() & (amounts != 0)).to_numpy()
+            processed_df = df[keep].copy()
+            amounts = amounts[keep]
 
             # Add index column to track original row numbers
             processed_df["original_index"] = processed_df.index
 
             # Extract amount and description
-            processed_df["amount"] = pd.to_numeric(
-                processed_df[amount_column], errors="coerce"
-            )
+            processed_df["amount"] = amounts
             processed_df["description"] = (
                 processed_df[description_column].astype(str).str.strip()
             )
 
-            # Remove rows with invalid amounts
-            processed_df = processed_df.dropna(subset=["amount"])
-
             # Identify transaction type
-            processed_df["transaction_type"] = processed_df["amount"].apply(
-                lambda x: "expense" if x < 0 else "revenue" if x > 0 else "zero"
+            amount_values = amounts.to_numpy()
+            processed_df["transaction_type"] = np.where(
+                amount_values < 0, "expense", "revenue"
             )
 
-            # Remove zero amount transactions
-            processed_df = processed_df[processed_df["transaction_type"] != "zero"]
-
             # Add absolute amount column for easier calculations
-            processed_df["abs_amount"] = processed_df["amount"].abs()
+            processed_df["abs_amount"] = np.abs(amount_values)
 
             # Add status columns for tracking
             processed_df["match_status"] = "unmatched"
@@ -244,18 +333,22 @@ class FileHandler:
             Dictionary containing summary statistics
         """
         try:
-            expenses = df[df["transaction_type"] == "expense"]
-            revenues = df[df["transaction_type"] == "revenue"]
+            # Work on boolean masks over the raw arrays instead of filtered copies
+            amounts = df["amount"].to_numpy(dtype=np.float64)
+            transaction_type = df["transaction_type"]
+            match_status = df["match_status"]
+            is_expense = (transaction_type == "expense").to_numpy()
+            is_revenue = (transaction_type == "revenue").to_numpy()
 
             summary = {
                 "total_transactions": len(df),
-                "expense_count": len(expenses),
-                "revenue_count": len(revenues),
-                "total_expense_amount": abs(expenses["amount"].sum()),
-                "total_revenue_amount": revenues["amount"].sum(),
-                "net_balance": df["amount"].sum(),
-                "matched_count": len(df[df["match_status"] == "matched"]),
-                "unmatched_count": len(df[df["match_status"] == "unmatched"]),
+                "expense_count": int(is_expense.sum()),
+                "revenue_count": int(is_revenue.sum()),
+                "total_expense_amount": abs(amounts[is_expense].sum()),
+                "total_revenue_amount": amounts[is_revenue].sum(),
+                "net_balance": amounts.sum(),
+                "matched_count": int((match_status == "matched").sum()),
+                "unmatched_count": int((match_status == "unmatched").sum()),
             }
 
             return summary
@@ -275,11 +368,47 @@ class FileHandler:
             Tuple of (success, message)
         """
         try:
-            df.to_csv(output_path, index=False)
+            write_csv(
+                df, output_path, fast=self.polars_csv, chunksize=self.csv_chunk_rows
+            )
             return True, f"File exported successfully to {output_path}"
         except Exception as e:
             return False, f"Error exporting to CSV: {str(e)}"
 
+    def export_to_parquet(self, df: pd.DataFrame, output_path: str) -> Tuple[bool, str]:
+        """
+        Export DataFrame to a zstd-compressed Parquet file
+
+        Args:
+            df: DataFrame to export
+            output_path: Path where file should be saved
+
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            df.to_parquet(output_path, engine="pyarrow", compression="zstd")
+            return True, f"File exported successfully to {output_path}"
+        except Exception as e:
+            return False, f"Error exporting to Parquet: {str(e)}"
+
+    def export_to_feather(self, df: pd.DataFrame, output_path: str) -> Tuple[bool, str]:
+        """
+        Export DataFrame to a zstd-compressed Feather file
+
+        Args:
+            df: DataFrame to export
+            output_path: Path where file should be saved
+
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            df.reset_index(drop=True).to_feather(output_path, compression="zstd")
+            return True, f"File exported successfully to {output_path}"
+        except Exception as e:
+            return False, f"Error exporting to Feather: {str(e)}"
+
     def export_to_excel(
         self, df: pd.DataFrame, output_path: str, highlight_matched: bool = False
     ) -> Tuple[bool, str]:
@@ -296,31 +425,14 @@ class FileHandler:
         """
         try:
             if highlight_matched:
-                # Export with formatting
-                with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                    df.to_excel(writer, index=False, sheet_name="Reconciliation")
-
-                    # Get workbook and worksheet
-                    workbook = writer.book
-                    worksheet = writer.sheets["Reconciliation"]
-
-                    # Apply highlighting
-                    from openpyxl.styles import PatternFill
-
-                    yellow_fill = PatternFill(
-                        start_color=self.config.DEFAULT_HIGHLIGHT_COLOR,
-                        end_color=self.config.DEFAULT_HIGHLIGHT_COLOR,
-                        fill_type="solid",
-                    )
-
-                    # Highlight matched rows (skip header)
-                    for idx, row in df.iterrows():
-                        if row.get("match_status") == "matched":
-                            excel_row = (
-                                idx + 2
-                            )  # +2 because Excel is 1-indexed and has header
-                            for cell in worksheet[excel_row]:
-                                cell.fill = yellow_fill
+                # Export with formatting, marking matched rows with a
+                # conditional format over a write-only workbook
+                workbook = Workbook(write_only=True)
+                worksheet = write_excel_sheet(workbook, "Reconciliation", df)
+                highlight_matched_rows(
+                    worksheet, df, self.config.DEFAULT_HIGHLIGHT_COLOR
+                )
+                workbook.save(output_path)
 
             else:
                 # Simple export without formatting